@@ -13,14 +13,25 @@ Inspired by claude-mem's observation architecture.
 """
 
 import json
+import queue
 import sqlite3
+import threading
 import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from copy import deepcopy
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal, Optional, Any
-from dataclasses import dataclass
+from typing import Iterator, Literal, Optional, Any
+from dataclasses import dataclass, replace
 import logging
 
+try:
+    import orjson
+except ImportError:  # Optional speedup - stdlib json is used as a fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Observation types (matching claude-mem)
@@ -36,6 +47,7 @@ ObservationType = Literal[
 OBSERVATION_TYPES = [
     "bugfix", "feature", "refactor", "change", "discovery", "decision"
 ]
+OBSERVATION_TYPES_SET = frozenset(OBSERVATION_TYPES)
 
 # Concept types (knowledge categories from claude-mem)
 ConceptType = Literal[
@@ -52,6 +64,7 @@ CONCEPT_TYPES = [
     "how-it-works", "why-it-exists", "what-changed", 
     "problem-solution", "gotcha", "pattern", "trade-off"
 ]
+CONCEPT_TYPES_SET = frozenset(CONCEPT_TYPES)
 
 # Legacy category support (for backward compatibility)
 MemoryCategory = Literal[
@@ -65,9 +78,84 @@ MEMORY_CATEGORIES = [
     "recipe", "coding_style", "tech_stack", "project_context", 
     "communication", "general"
 ]
+MEMORY_CATEGORIES_SET = frozenset(MEMORY_CATEGORIES)
+
+
+# Columns read for a Memory, in the order _row_to_memory() unpacks them. Naming
+# them (rather than SELECT *) keeps the order fixed even for databases whose
+# newer columns were appended by migrations.
+MEMORY_COLUMNS = (
+    "id", "type", "title", "subtitle", "content", "facts_json", "concepts_json",
+    "files_read_json", "files_modified_json", "session_id", "project",
+    "category", "importance", "tags_json", "metadata_json", "created_at",
+    "accessed_count", "discovery_tokens",
+)
+# Qualified so the same select list also works when joined with memories_fts
+_MEMORY_SELECT = (
+    "SELECT " + ", ".join(f"memories.{c}" for c in MEMORY_COLUMNS) + " FROM memories"
+)
+
+
+# WHERE clauses for list_all()'s filters, in the order their values are bound
+_LIST_FILTERS = (
+    "type = ?",
+    "category = ?",
+    "project = ?",
+    "session_id = ?",
+    "importance >= ?",
+    "created_at_epoch >= ?",
+)
+
+
+@lru_cache(maxsize=128)
+def _list_query(
+    filters: tuple[bool, ...], concept_count: int, match_all: bool, limited: bool
+) -> str:
+    """Build list_all()'s SQL once per combination of filters in use."""
+    query = _MEMORY_SELECT + " WHERE 1=1"
+    for clause, used in zip(_LIST_FILTERS, filters):
+        if used:
+            query += " AND " + clause
+    
+    if concept_count:
+        # Match any (OR) or all (AND) of the provided concepts
+        joiner = " AND " if match_all else " OR "
+        query += " AND (" + joiner.join(["concepts_json LIKE ?"] * concept_count) + ")"
+    
+    query += " ORDER BY importance DESC, created_at_epoch DESC"
+    
+    if limited:
+        # Bound rather than inlined so every limit shares one cached statement
+        query += " LIMIT ?"
+    return query
+
+
+def _json_dumps(value: Any) -> str:
+    """
+    Encode a value for a *_json column.
+
+    Keeps json.dumps() defaults (ASCII escapes, spaced separators) so new
+    rows match rows already stored; the LIKE filters depend on it.
+    """
+    return json.dumps(value)
+
+
+def _json_like(value: str) -> str:
+    """LIKE pattern matching a string element inside a *_json column."""
+    return f"%{json.dumps(value)}%"
+
 
+# Decoder for *_json columns; bound directly (no wrapper call) since it runs
+# several times for every row read
+_json_loads = orjson.loads if orjson is not None else json.loads
 
-@dataclass
+
+def _quote_fts(query: str) -> str:
+    """Quote each term of a free-text query so FTS5 treats it as plain text."""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+
+@dataclass(slots=True)
 class Memory:
     """A memory/observation entry with rich metadata."""
     id: str
@@ -139,7 +227,26 @@ class Memory:
         }
 
 
-@dataclass
+def _copy_memory(memory: Memory, **changes: Any) -> Memory:
+    """
+    Copy a cached memory for handing out to a caller.
+
+    The list and dict fields are copied too, so callers that mutate what
+    they get back can't change the cached original.
+    """
+    return replace(
+        memory,
+        facts=list(memory.facts),
+        concepts=list(memory.concepts),
+        files_read=list(memory.files_read),
+        files_modified=list(memory.files_modified),
+        tags=list(memory.tags),
+        metadata=deepcopy(memory.metadata),
+        **changes,
+    )
+
+
+@dataclass(slots=True)
 class SessionSummary:
     """Session progress summary (claude-mem style)."""
     id: str
@@ -182,7 +289,7 @@ class SessionSummary:
         }
 
 
-@dataclass  
+@dataclass(slots=True)
 class Session:
     """Active session tracking."""
     id: str
@@ -211,33 +318,134 @@ class MemoryStore:
     """SQLite-based memory storage with FTS5 search."""
 
     SCHEMA_VERSION = 2  # Bump when schema changes
+    MMAP_SIZE = 256 * 1024 * 1024  # Bytes of the database file memory-mapped
+    CACHE_SIZE_KIB = -64 * 1024  # SQLite page cache per connection (negative = KiB)
+    STATEMENT_CACHE_SIZE = 512  # Prepared statements kept per connection
+    RECENT_CACHE_SIZE = 64  # Unfiltered list_all() results kept in memory
+    CONCEPT_CACHE_SIZE = 128  # Distinct (concept, limit) searches kept in memory
+    GET_CACHE_SIZE = 256  # Memories kept in memory for repeated get() calls
+    ACCESS_FLUSH_INTERVAL = 32  # get() calls buffered before writing access counts
 
-    def __init__(self, db_path: Optional[str | Path] = None, max_memories: int = 1000):
+    def __init__(
+        self,
+        db_path: Optional[str | Path] = None,
+        max_memories: int = 1000,
+        pool_size: int = 8,
+        pragmas: Optional[dict[str, str | int]] = None,
+    ):
         """
         Initialize the memory store.
 
         Args:
-            db_path: Path to SQLite database. Defaults to ~/.amplifier/memories.db
+            db_path: Path to SQLite database. Defaults to ~/.amplifier/memories.db.
+                Pass ":memory:" for a private in-memory database (operations on
+                it are serialized, which suits tests and scratch stores).
             max_memories: Maximum memories to store (oldest removed when exceeded)
+            pool_size: Maximum idle connections kept open for reuse
+            pragmas: Extra PRAGMA settings applied to every connection after
+                the defaults, e.g. {"synchronous": "OFF"} for throwaway stores.
+                Not for production databases.
         """
+        in_memory = db_path == ":memory:"
         if db_path is None:
             db_path = Path.home() / ".amplifier" / "memories.db"
-        elif isinstance(db_path, str):
+        elif isinstance(db_path, str) and not in_memory:
             db_path = Path(db_path).expanduser()
             
         self.db_path = db_path
         self.max_memories = max_memories
-        
-        # Ensure directory exists
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pragmas = dict(pragmas or {})
+        
+        # Idle connections, reused across operations (and threads)
+        self._pool: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        self._pool_size = pool_size
+        
+        # Read caches, dropped whenever memories change (see _invalidate_caches)
+        self._cache_lock = threading.Lock()
+        self._version = 0
+        self._recent: Optional[list[Memory]] = None
+        self._concept_cache: OrderedDict[tuple[str, int], list[Memory]] = OrderedDict()
+        self._get_cache: OrderedDict[str, Memory] = OrderedDict()
+        # Access counts from get() not yet written, by memory id
+        self._pending_access: dict[str, int] = {}
+        self._pending_hits = 0
+        
+        # An in-memory database is private to the connection that created it,
+        # so the store keeps that one connection and runs its operations one
+        # at a time (see _connect)
+        self._memory_lock = threading.RLock()
+        if in_memory:
+            self._memory_conn: Optional[sqlite3.Connection] = self._open_connection()
+        else:
+            self._memory_conn = None
+            # Ensure directory exists
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Other stores and processes may share the database file; a dedicated
+        # connection, opened on demand, notices their writes (see
+        # _check_external_writes)
+        self._watch: Optional[sqlite3.Connection] = None
+        self._data_version = self._read_data_version()
         
         # Initialize database
         self._init_db()
         self._run_migrations()
 
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a new connection configured for pooled, multi-threaded use."""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=self.STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        # WAL lets readers proceed while a writer commits; NORMAL is durable
+        # across application crashes and only fsyncs at checkpoints
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Reads are the bulk of the workload: serve pages straight from the
+        # OS page cache via mmap, keep up to 64 MiB of pages per connection,
+        # and keep sorter/temp B-trees off disk
+        conn.execute(f"PRAGMA mmap_size={self.MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size={self.CACHE_SIZE_KIB}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        for name, value in self._pragmas.items():
+            conn.execute(f"PRAGMA {name}={value}")
+        return conn
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Check out a pooled connection for one operation.
+
+        The operation runs in a transaction that commits on success and rolls
+        back on error; the connection is returned to the pool afterwards.
+        In-memory stores use their single connection under a lock instead.
+        """
+        if self._memory_conn is not None:
+            with self._memory_lock, self._memory_conn:
+                yield self._memory_conn
+            return
+        
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_connection()
+        try:
+            changes = conn.total_changes
+            with conn:
+                yield conn
+            if conn.total_changes != changes:
+                self._note_own_write()
+        finally:
+            if self._pool.qsize() < self._pool_size:
+                self._pool.put(conn)
+            else:
+                conn.close()
+
     def _init_db(self):
         """Initialize the SQLite database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             # Schema version tracking
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS schema_version (
@@ -335,19 +543,46 @@ class MemoryStore:
             """)
             
             # Indexes
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_memories_type ON memories(type)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_memories_category ON memories(category)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_memories_created ON memories(created_at_epoch DESC)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_memories_importance ON memories(importance DESC)")
+            
+            # Composite indexes matching list_all()'s ORDER BY, so importance
+            # and type filters walk the index in order and stop at LIMIT
+            # instead of sorting every match in a temp B-tree
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_memories_importance_created
+                ON memories(importance DESC, created_at_epoch DESC)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_memories_type_importance
+                ON memories(type, importance DESC, created_at_epoch DESC)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_memories_category_importance
+                ON memories(category, importance DESC, created_at_epoch DESC)
+            """)
+            # Per-project listings (session context) likewise read just that
+            # project's slice of the index, already in result order
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_memories_project_importance
+                ON memories(project, importance DESC, created_at_epoch DESC)
+            """)
+            # Superseded by the composite indexes above
+            conn.execute("DROP INDEX IF EXISTS idx_memories_importance")
+            conn.execute("DROP INDEX IF EXISTS idx_memories_type")
+            conn.execute("DROP INDEX IF EXISTS idx_memories_category")
+            conn.execute("DROP INDEX IF EXISTS idx_memories_project")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_memories_session ON memories(session_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_memories_project ON memories(project)")
             
             conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_session_id ON sessions(session_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_project ON sessions(project)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_status ON sessions(status)")
             
             conn.execute("CREATE INDEX IF NOT EXISTS idx_summaries_session ON session_summaries(session_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_summaries_project ON session_summaries(project)")
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_summaries_project_created
+                ON session_summaries(project, created_at_epoch DESC)
+            """)
+            conn.execute("DROP INDEX IF EXISTS idx_summaries_project")
             
             conn.execute("CREATE INDEX IF NOT EXISTS idx_prompts_session ON user_prompts(session_id)")
             
@@ -355,7 +590,7 @@ class MemoryStore:
 
     def _run_migrations(self):
         """Run database migrations."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             # Get current version
             try:
                 row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
@@ -577,9 +812,62 @@ class MemoryStore:
         Returns:
             The created Memory
         """
+        memory = self._new_memory(
+            content=content,
+            type=type,
+            title=title,
+            subtitle=subtitle,
+            facts=facts,
+            concepts=concepts,
+            files_read=files_read,
+            files_modified=files_modified,
+            session_id=session_id,
+            project=project,
+            category=category,
+            importance=importance,
+            tags=tags,
+            metadata=metadata,
+            discovery_tokens=discovery_tokens,
+        )
+        self._insert_memories([memory])
+        return memory
+
+    def add_many(self, items: list[dict[str, Any]]) -> list[Memory]:
+        """
+        Add several memories in a single transaction.
+
+        Args:
+            items: One dict of add() keyword arguments per memory
+
+        Returns:
+            The created memories, in input order
+        """
+        memories = [self._new_memory(**item) for item in items]
+        if memories:
+            self._insert_memories(memories)
+        return memories
+
+    def _new_memory(
+        self,
+        content: str,
+        type: str = "change",
+        title: str = "",
+        subtitle: str = "",
+        facts: Optional[list[str]] = None,
+        concepts: Optional[list[str]] = None,
+        files_read: Optional[list[str]] = None,
+        files_modified: Optional[list[str]] = None,
+        session_id: Optional[str] = None,
+        project: Optional[str] = None,
+        category: str = "general",
+        importance: float = 0.5,
+        tags: Optional[list[str]] = None,
+        metadata: Optional[dict] = None,
+        discovery_tokens: int = 0,
+    ) -> Memory:
+        """Build a validated, not yet persisted Memory from add() arguments."""
         memory_id = str(uuid.uuid4())
         created_at = datetime.now()
-        created_at_epoch = int(created_at.timestamp() * 1000)
         
         facts = facts or []
         concepts = concepts or []
@@ -589,44 +877,20 @@ class MemoryStore:
         metadata = metadata or {}
         
         # Validate type
-        if type not in OBSERVATION_TYPES:
+        if type not in OBSERVATION_TYPES_SET:
             type = "change"
         
         # Validate category
-        if category not in MEMORY_CATEGORIES:
+        if category not in MEMORY_CATEGORIES_SET:
             category = "general"
         
-        # Clamp importance
-        importance = max(0.0, min(1.0, importance))
+        # Clamp importance (comparisons rather than max()/min() calls)
+        importance = 0.0 if importance < 0.0 else 1.0 if importance > 1.0 else importance
         
         # Auto-generate title if not provided
         if not title and content:
             title = content[:50] + ("..." if len(content) > 50 else "")
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO memories (
-                    id, type, title, subtitle, content, facts_json, concepts_json,
-                    files_read_json, files_modified_json, session_id, project,
-                    category, importance, tags_json, metadata_json,
-                    created_at, created_at_epoch, accessed_count, discovery_tokens
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                memory_id, type, title, subtitle, content,
-                json.dumps(facts), json.dumps(concepts),
-                json.dumps(files_read), json.dumps(files_modified),
-                session_id, project,
-                category, importance, json.dumps(tags), json.dumps(metadata),
-                created_at.isoformat(), created_at_epoch, 0, discovery_tokens,
-            ))
-            conn.commit()
-        
-        # Enforce limit
-        self._enforce_limit()
-        
-        logger.info(f"Added memory {memory_id}: [{type}] {title}")
-        
         return Memory(
             id=memory_id,
             type=type,
@@ -648,20 +912,75 @@ class MemoryStore:
             discovery_tokens=discovery_tokens,
         )
 
+    def _insert_memories(self, memories: list[Memory]):
+        """Persist new memories in one transaction, then enforce the limit."""
+        with self._connect() as conn:
+            conn.executemany("""
+                INSERT INTO memories (
+                    id, type, title, subtitle, content, facts_json, concepts_json,
+                    files_read_json, files_modified_json, session_id, project,
+                    category, importance, tags_json, metadata_json,
+                    created_at, created_at_epoch, accessed_count, discovery_tokens
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
+                    m.id, m.type, m.title, m.subtitle, m.content,
+                    _json_dumps(m.facts), _json_dumps(m.concepts),
+                    _json_dumps(m.files_read), _json_dumps(m.files_modified),
+                    m.session_id, m.project,
+                    m.category, m.importance, _json_dumps(m.tags), _json_dumps(m.metadata),
+                    m.created_at.isoformat(), int(m.created_at.timestamp() * 1000),
+                    0, m.discovery_tokens,
+                )
+                for m in memories
+            ])
+        
+        self._invalidate_caches()
+        
+        # Enforce limit
+        self._enforce_limit()
+        
+        for m in memories:
+            logger.info(f"Added memory {m.id}: [{m.type}] {m.title}")
+
     def get(self, memory_id: str) -> Optional[Memory]:
-        """Get a memory by ID and increment access count."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
-            row = conn.execute("SELECT * FROM memories WHERE id = ?", (memory_id,)).fetchone()
+        """
+        Get a memory by ID and increment access count.
+
+        Recently fetched memories are served from memory, as copies the caller
+        may modify freely. Access counts are buffered and written in batches
+        (see _flush_access); the returned memory already includes them.
+        """
+        with self._cache_lock:
+            self._check_external_writes()
+            cached = self._get_cache.get(memory_id)
+            if cached is not None:
+                cached.accessed_count += 1
+                self._get_cache.move_to_end(memory_id)
+                memory = _copy_memory(cached)
+                flush = self._record_access(memory_id)
+            version = self._version
+        
+        if cached is None:
+            with self._connect() as conn:
+                row = conn.execute(_MEMORY_SELECT + " WHERE id = ?", (memory_id,)).fetchone()
             if row is None:
                 return None
             
-            # Increment access count
-            conn.execute("UPDATE memories SET accessed_count = accessed_count + 1 WHERE id = ?", (memory_id,))
-            conn.commit()
-            
-            return self._row_to_memory(row)
+            memory = self._row_to_memory(row)
+            with self._cache_lock:
+                memory.accessed_count += self._pending_access.get(memory_id, 0) + 1
+                flush = self._record_access(memory_id)
+                if self._version == version:
+                    self._get_cache[memory_id] = memory
+                    if len(self._get_cache) > self.GET_CACHE_SIZE:
+                        self._get_cache.popitem(last=False)
+                    memory = _copy_memory(memory)
+        
+        if flush:
+            self._flush_access()
+        return memory
 
     def list_all(
         self,
@@ -673,6 +992,7 @@ class MemoryStore:
         session_id: Optional[str] = None,
         min_importance: Optional[float] = None,
         since_epoch: Optional[int] = None,
+        concepts_match: Literal["any", "all"] = "any",
     ) -> list[Memory]:
         """
         List memories with optional filtering.
@@ -681,72 +1001,118 @@ class MemoryStore:
             limit: Maximum number to return
             type: Filter by observation type
             category: Filter by category
-            concepts: Filter by concepts (any match)
+            concepts: Filter by concepts
             project: Filter by project
             session_id: Filter by session
             min_importance: Filter by minimum importance
             since_epoch: Filter by creation time (epoch ms)
+            concepts_match: "any" to match memories with at least one of the
+                concepts, "all" to require every concept
 
         Returns:
             List of memories
         """
-        query = "SELECT * FROM memories WHERE 1=1"
-        params: list[Any] = []
+        # The unfiltered "most important/recent" listing is by far the most
+        # common call, so serve it from memory when possible
+        cacheable = (
+            limit is not None
+            and 0 < limit <= self.RECENT_CACHE_SIZE
+            and not (type or category or project or session_id or concepts)
+            and min_importance is None
+            and since_epoch is None
+        )
+        if cacheable:
+            with self._cache_lock:
+                self._check_external_writes()
+                recent = self._recent
+                version = self._version
+            if recent is not None:
+                return self._add_pending_access([_copy_memory(m) for m in recent[:limit]])
+            original_limit, limit = limit, self.RECENT_CACHE_SIZE
+        
+        # Filter values in _LIST_FILTERS order; empty strings mean "no filter"
+        values = (
+            type or None,
+            category or None,
+            project or None,
+            session_id or None,
+            min_importance,
+            since_epoch,
+        )
+        query = _list_query(
+            tuple(value is not None for value in values),
+            len(concepts) if concepts else 0,
+            concepts_match == "all",
+            bool(limit),
+        )
+        params: list[Any] = [value for value in values if value is not None]
+        if concepts:
+            params.extend(_json_like(concept) for concept in concepts)
+        if limit:
+            params.append(limit)
         
-        if type:
-            query += " AND type = ?"
-            params.append(type)
+        with self._connect() as conn:
+            memories = [self._row_to_memory(row) for row in conn.execute(query, params)]
         
-        if category:
-            query += " AND category = ?"
-            params.append(category)
+        if cacheable:
+            with self._cache_lock:
+                # Don't publish results a concurrent write has already outdated
+                if self._version == version:
+                    self._recent = memories
+            return self._add_pending_access([_copy_memory(m) for m in memories[:original_limit]])
+        return self._add_pending_access(memories)
+
+    def list_index(
+        self,
+        limit: int = 50,
+        project: Optional[str] = None,
+        since_epoch: Optional[int] = None,
+    ) -> list[dict]:
+        """
+        Get index view of memories (progressive disclosure layer 1).
+        Returns minimal info with token estimates for cost-aware retrieval.
+        """
+        if project is None and since_epoch is None:
+            # Served from list_all()'s cache of the most important memories
+            return [m.to_index() for m in self.list_all(limit=limit)]
+        
+        # Filtered views (e.g. session context) read only the index columns and
+        # build the Memory.to_index() shape in one pass, estimating tokens in SQL
+        query = """
+            SELECT id, type, title, subtitle, concepts_json, created_at,
+                   length(content) / 4
+            FROM memories WHERE 1=1
+        """
+        params: list[Any] = []
         
         if project:
             query += " AND project = ?"
             params.append(project)
         
-        if session_id:
-            query += " AND session_id = ?"
-            params.append(session_id)
-        
-        if min_importance is not None:
-            query += " AND importance >= ?"
-            params.append(min_importance)
-        
         if since_epoch is not None:
             query += " AND created_at_epoch >= ?"
             params.append(since_epoch)
         
-        if concepts:
-            # Match any of the provided concepts
-            concept_conditions = []
-            for concept in concepts:
-                concept_conditions.append("concepts_json LIKE ?")
-                params.append(f'%"{concept}"%')
-            query += f" AND ({' OR '.join(concept_conditions)})"
-        
         query += " ORDER BY importance DESC, created_at_epoch DESC"
         
         if limit:
-            query += f" LIMIT {limit}"
+            query += " LIMIT ?"
+            params.append(limit)
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(query, params).fetchall()
-            return [self._row_to_memory(row) for row in rows]
-
-    def list_index(
-        self,
-        limit: int = 50,
-        project: Optional[str] = None,
-        since_epoch: Optional[int] = None,
-    ) -> list[dict]:
-        """
-        Get index view of memories (progressive disclosure layer 1).
-        Returns minimal info with token estimates for cost-aware retrieval.
-        """
-        memories = self.list_all(limit=limit, project=project, since_epoch=since_epoch)
-        return [m.to_index() for m in memories]
+        with self._connect() as conn:
+            return [
+                {
+                    "id": id_,
+                    "type": type_,
+                    "title": title,
+                    "subtitle": subtitle,
+                    "concepts": _json_loads(concepts_json) if concepts_json else [],
+                    "created_at": created_at,
+                    "token_estimate": token_estimate,
+                }
+                for id_, type_, title, subtitle, concepts_json, created_at, token_estimate
+                in conn.execute(query, params)
+            ]
 
     def search(
         self, 
@@ -754,7 +1120,8 @@ class MemoryStore:
         limit: int = 10,
         type: Optional[str] = None,
         project: Optional[str] = None,
-    ) -> list[Memory]:
+        as_dicts: bool = False,
+    ) -> list[Memory] | list[dict]:
         """
         Full-text search using FTS5.
 
@@ -763,40 +1130,73 @@ class MemoryStore:
             limit: Maximum results
             type: Optional type filter
             project: Optional project filter
+            as_dicts: Return Memory.to_dict() views built straight from the
+                rows instead of Memory objects
 
         Returns:
             List of matching memories sorted by relevance
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
+        convert = self._row_to_memory_dict if as_dicts else self._row_to_memory
+        with self._connect() as conn:
             # Use FTS5 for search
-            fts_query = f"""
-                SELECT m.*, fts.rank
-                FROM memories m
-                JOIN memories_fts fts ON m.rowid = fts.rowid
-                WHERE memories_fts MATCH ?
-            """
-            params: list[Any] = [query]
-            
-            if type:
-                fts_query += " AND m.type = ?"
-                params.append(type)
-            
-            if project:
-                fts_query += " AND m.project = ?"
-                params.append(project)
-            
-            fts_query += " ORDER BY fts.rank LIMIT ?"
+            params: list[Any] = []
+            if type or project:
+                fts_query = _MEMORY_SELECT + """
+                    JOIN memories_fts fts ON memories.rowid = fts.rowid
+                    WHERE memories_fts MATCH ?
+                """
+                
+                if type:
+                    fts_query += " AND memories.type = ?"
+                    params.append(type)
+                
+                if project:
+                    fts_query += " AND memories.project = ?"
+                    params.append(project)
+                
+                fts_query += " ORDER BY fts.rank LIMIT ?"
+            else:
+                # Without filters on memories, rank and limit inside the FTS5
+                # scan so only the top hits are joined back to their rows
+                fts_query = """
+                    WITH hits AS (
+                        SELECT rowid, rank FROM memories_fts
+                        WHERE memories_fts MATCH ?
+                        ORDER BY rank LIMIT ?
+                    )
+                """ + _MEMORY_SELECT + """
+                    JOIN hits ON memories.rowid = hits.rowid
+                    ORDER BY hits.rank
+                """
             params.append(limit)
             
             try:
-                rows = conn.execute(fts_query, params).fetchall()
-                return [self._row_to_memory(row) for row in rows]
+                results = [convert(row) for row in self._fts_execute(conn, fts_query, query, params)]
             except sqlite3.OperationalError as e:
                 # Fallback to LIKE search if FTS fails
                 logger.warning(f"FTS5 search failed, falling back to LIKE: {e}")
-                return self._search_fallback(query, limit, type, project)
+                memories = self._search_fallback(query, limit, type, project)
+                results = [m.to_dict() for m in memories] if as_dicts else memories
+        
+        return self._add_pending_access(results)
+
+    def _fts_execute(
+        self, conn: sqlite3.Connection, sql: str, query: str, params: Any = ()
+    ) -> sqlite3.Cursor:
+        """
+        Run an FTS5 MATCH query, with the query bound as the first parameter.
+
+        Queries that aren't valid FTS5 syntax (stray punctuation such as
+        "what's" or "C++") are retried with every term quoted, so they stay on
+        the index instead of dropping to the LIKE scan.
+        """
+        try:
+            return conn.execute(sql, (query, *params))
+        except sqlite3.OperationalError:
+            quoted = _quote_fts(query)
+            if quoted == query:
+                raise
+            return conn.execute(sql, (quoted, *params))
 
     def _search_fallback(
         self, 
@@ -808,10 +1208,8 @@ class MemoryStore:
         """Fallback search using LIKE (for when FTS5 isn't available)."""
         search_terms = query.lower().split()
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
-            base_query = "SELECT * FROM memories WHERE 1=1"
+        with self._connect() as conn:
+            base_query = _MEMORY_SELECT + " WHERE 1=1"
             params: list[Any] = []
             
             if type:
@@ -824,10 +1222,8 @@ class MemoryStore:
             
             base_query += " ORDER BY importance DESC, created_at_epoch DESC"
             
-            rows = conn.execute(base_query, params).fetchall()
-            
             results = []
-            for row in rows:
+            for row in conn.execute(base_query, params):
                 searchable = (
                     (row["title"] or "").lower() + " " +
                     (row["subtitle"] or "").lower() + " " +
@@ -845,29 +1241,47 @@ class MemoryStore:
             results.sort(key=lambda x: x[0], reverse=True)
             return [m for _, m in results[:limit]]
 
-    def search_by_file(self, file_path: str, limit: int = 10) -> list[Memory]:
-        """Search memories by file path (read or modified)."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute("""
-                SELECT * FROM memories 
+    def search_by_file(
+        self, file_path: str, limit: int = 10, as_dicts: bool = False
+    ) -> list[Memory] | list[dict]:
+        """Search memories by file path (read or modified); see search() for as_dicts."""
+        convert = self._row_to_memory_dict if as_dicts else self._row_to_memory
+        with self._connect() as conn:
+            rows = conn.execute(_MEMORY_SELECT + """
                 WHERE files_read_json LIKE ? OR files_modified_json LIKE ?
                 ORDER BY created_at_epoch DESC
                 LIMIT ?
-            """, (f'%"{file_path}"%', f'%"{file_path}"%', limit)).fetchall()
-            return [self._row_to_memory(row) for row in rows]
+            """, (_json_like(file_path), _json_like(file_path), limit))
+            results = [convert(row) for row in rows]
+        return self._add_pending_access(results)
 
     def search_by_concept(self, concept: str, limit: int = 10) -> list[Memory]:
-        """Search memories by concept tag."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute("""
-                SELECT * FROM memories 
+        """Search memories by concept tag (results cached until the next write)."""
+        key = (concept, limit)
+        with self._cache_lock:
+            self._check_external_writes()
+            cached = self._concept_cache.get(key)
+            if cached is not None:
+                self._concept_cache.move_to_end(key)
+            version = self._version
+        
+        if cached is not None:
+            return self._add_pending_access([_copy_memory(m) for m in cached])
+        
+        with self._connect() as conn:
+            rows = conn.execute(_MEMORY_SELECT + """
                 WHERE concepts_json LIKE ?
                 ORDER BY importance DESC, created_at_epoch DESC
                 LIMIT ?
-            """, (f'%"{concept}"%', limit)).fetchall()
-            return [self._row_to_memory(row) for row in rows]
+            """, (_json_like(concept), limit))
+            memories = [self._row_to_memory(row) for row in rows]
+        
+        with self._cache_lock:
+            if self._version == version:
+                self._concept_cache[key] = memories
+                if len(self._concept_cache) > self.CONCEPT_CACHE_SIZE:
+                    self._concept_cache.popitem(last=False)
+        return self._add_pending_access([_copy_memory(m) for m in memories])
 
     def update(
         self,
@@ -893,7 +1307,7 @@ class MemoryStore:
         if content is not None:
             updates.append("content = ?")
             params.append(content)
-        if type is not None and type in OBSERVATION_TYPES:
+        if type is not None and type in OBSERVATION_TYPES_SET:
             updates.append("type = ?")
             params.append(type)
         if title is not None:
@@ -904,19 +1318,19 @@ class MemoryStore:
             params.append(subtitle)
         if facts is not None:
             updates.append("facts_json = ?")
-            params.append(json.dumps(facts))
+            params.append(_json_dumps(facts))
         if concepts is not None:
             updates.append("concepts_json = ?")
-            params.append(json.dumps(concepts))
-        if category is not None and category in MEMORY_CATEGORIES:
+            params.append(_json_dumps(concepts))
+        if category is not None and category in MEMORY_CATEGORIES_SET:
             updates.append("category = ?")
             params.append(category)
         if importance is not None:
             updates.append("importance = ?")
-            params.append(max(0.0, min(1.0, importance)))
+            params.append(0.0 if importance < 0.0 else 1.0 if importance > 1.0 else importance)
         if tags is not None:
             updates.append("tags_json = ?")
-            params.append(json.dumps(tags))
+            params.append(_json_dumps(tags))
         
         if not updates:
             return existing
@@ -924,22 +1338,27 @@ class MemoryStore:
         params.append(memory_id)
         query = f"UPDATE memories SET {', '.join(updates)} WHERE id = ?"
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute(query, params)
             conn.commit()
         
+        self._invalidate_caches()
+        self._evict(memory_id)
         return self.get(memory_id)
 
     def delete(self, memory_id: str) -> bool:
         """Delete a memory by ID."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
             conn.commit()
-            return cursor.rowcount > 0
+        
+        self._invalidate_caches()
+        self._evict(memory_id)
+        return cursor.rowcount > 0
 
     def count(self) -> int:
         """Get total memory count."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             return conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
 
     # -------------------------------------------------------------------------
@@ -956,9 +1375,7 @@ class MemoryStore:
         now = datetime.now()
         internal_id = str(uuid.uuid4())
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
+        with self._connect() as conn:
             # Check if session exists
             row = conn.execute(
                 "SELECT * FROM sessions WHERE session_id = ?", (session_id,)
@@ -1001,7 +1418,7 @@ class MemoryStore:
     def complete_session(self, session_id: str, status: str = "completed") -> bool:
         """Mark a session as completed."""
         now = datetime.now()
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute("""
                 UPDATE sessions 
                 SET status = ?, completed_at = ?, completed_at_epoch = ?
@@ -1012,8 +1429,7 @@ class MemoryStore:
 
     def get_session(self, session_id: str) -> Optional[Session]:
         """Get a session by ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT * FROM sessions WHERE session_id = ?", (session_id,)
             ).fetchone()
@@ -1031,10 +1447,8 @@ class MemoryStore:
         query += " ORDER BY started_at_epoch DESC LIMIT ?"
         params.append(limit)
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(query, params).fetchall()
-            return [self._row_to_session(row) for row in rows]
+        with self._connect() as conn:
+            return [self._row_to_session(row) for row in conn.execute(query, params)]
 
     # -------------------------------------------------------------------------
     # User Prompt Operations  
@@ -1050,7 +1464,7 @@ class MemoryStore:
         prompt_id = str(uuid.uuid4())
         now = datetime.now()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute("""
                 INSERT INTO user_prompts (id, session_id, prompt_number, prompt_text, created_at, created_at_epoch)
                 VALUES (?, ?, ?, ?, ?, ?)
@@ -1064,25 +1478,23 @@ class MemoryStore:
 
     def search_prompts(self, query: str, limit: int = 10) -> list[dict]:
         """Search user prompts using FTS5."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
+        with self._connect() as conn:
             try:
-                rows = conn.execute("""
+                rows = self._fts_execute(conn, """
                     SELECT p.*, fts.rank
                     FROM user_prompts p
                     JOIN prompts_fts fts ON p.rowid = fts.rowid
                     WHERE prompts_fts MATCH ?
                     ORDER BY fts.rank
                     LIMIT ?
-                """, (query, limit)).fetchall()
+                """, query, (limit,))
             except sqlite3.OperationalError:
                 rows = conn.execute("""
                     SELECT * FROM user_prompts
                     WHERE prompt_text LIKE ?
                     ORDER BY created_at_epoch DESC
                     LIMIT ?
-                """, (f"%{query}%", limit)).fetchall()
+                """, (f"%{query}%", limit))
             
             return [dict(row) for row in rows]
 
@@ -1111,7 +1523,7 @@ class MemoryStore:
         files_read = files_read or []
         files_edited = files_edited or []
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute("""
                 INSERT INTO session_summaries (
                     id, session_id, project, request, investigated, learned,
@@ -1121,7 +1533,7 @@ class MemoryStore:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 summary_id, session_id, project, request, investigated, learned,
-                completed, next_steps, notes, json.dumps(files_read), json.dumps(files_edited),
+                completed, next_steps, notes, _json_dumps(files_read), _json_dumps(files_edited),
                 discovery_tokens, now.isoformat(), int(now.timestamp() * 1000)
             ))
             conn.commit()
@@ -1147,8 +1559,10 @@ class MemoryStore:
         session_id: Optional[str] = None,
         project: Optional[str] = None,
         limit: int = 10,
-    ) -> list[SessionSummary]:
-        """Get session summaries."""
+        as_dicts: bool = False,
+    ) -> list[SessionSummary] | list[dict]:
+        """Get session summaries; see search() for as_dicts."""
+        convert = self._row_to_summary_dict if as_dicts else self._row_to_summary
         query = "SELECT * FROM session_summaries WHERE 1=1"
         params: list[Any] = []
         
@@ -1163,25 +1577,21 @@ class MemoryStore:
         query += " ORDER BY created_at_epoch DESC LIMIT ?"
         params.append(limit)
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(query, params).fetchall()
-            return [self._row_to_summary(row) for row in rows]
+        with self._connect() as conn:
+            return [convert(row) for row in conn.execute(query, params)]
 
     def search_summaries(self, query: str, limit: int = 10) -> list[SessionSummary]:
         """Search session summaries using FTS5."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
+        with self._connect() as conn:
             try:
-                rows = conn.execute("""
+                rows = self._fts_execute(conn, """
                     SELECT s.*, fts.rank
                     FROM session_summaries s
                     JOIN summaries_fts fts ON s.rowid = fts.rowid
                     WHERE summaries_fts MATCH ?
                     ORDER BY fts.rank
                     LIMIT ?
-                """, (query, limit)).fetchall()
+                """, query, (limit,))
                 return [self._row_to_summary(row) for row in rows]
             except sqlite3.OperationalError:
                 # Fallback to LIKE search
@@ -1191,7 +1601,7 @@ class MemoryStore:
                           OR completed LIKE ? OR next_steps LIKE ?
                     ORDER BY created_at_epoch DESC
                     LIMIT ?
-                """, (f"%{query}%",) * 5 + (limit,)).fetchall()
+                """, (f"%{query}%",) * 5 + (limit,))
                 return [self._row_to_summary(row) for row in rows]
 
     # -------------------------------------------------------------------------
@@ -1223,9 +1633,9 @@ class MemoryStore:
         
         # Get last summary
         if include_summaries:
-            summaries = self.get_summaries(project=project, limit=1)
+            summaries = self.get_summaries(project=project, limit=1, as_dicts=True)
             if summaries:
-                result["last_summary"] = summaries[0].to_dict()
+                result["last_summary"] = summaries[0]
         
         return result
 
@@ -1255,12 +1665,9 @@ class MemoryStore:
         start_epoch = center_epoch - window_ms
         end_epoch = center_epoch + window_ms
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
+        with self._connect() as conn:
             # Get observations in window
-            obs_query = """
-                SELECT * FROM memories 
+            obs_query = _MEMORY_SELECT + """
                 WHERE created_at_epoch BETWEEN ? AND ?
             """
             obs_params: list[Any] = [start_epoch, end_epoch]
@@ -1272,7 +1679,9 @@ class MemoryStore:
             obs_query += " ORDER BY created_at_epoch DESC LIMIT ?"
             obs_params.append(limit)
             
-            obs_rows = conn.execute(obs_query, obs_params).fetchall()
+            observations = self._add_pending_access(
+                [self._row_to_memory_dict(r) for r in conn.execute(obs_query, obs_params)]
+            )
             
             # Get summaries in window
             sum_query = """
@@ -1288,13 +1697,13 @@ class MemoryStore:
             sum_query += " ORDER BY created_at_epoch DESC LIMIT ?"
             sum_params.append(limit)
             
-            sum_rows = conn.execute(sum_query, sum_params).fetchall()
+            summaries = [self._row_to_summary_dict(r) for r in conn.execute(sum_query, sum_params)]
         
         return {
             "center_epoch": center_epoch,
             "window_hours": window_hours,
-            "observations": [self._row_to_memory(r).to_dict() for r in obs_rows],
-            "summaries": [self._row_to_summary(r).to_dict() for r in sum_rows],
+            "observations": observations,
+            "summaries": summaries,
         }
 
     # -------------------------------------------------------------------------
@@ -1302,28 +1711,69 @@ class MemoryStore:
     # -------------------------------------------------------------------------
     
     def _row_to_memory(self, row: sqlite3.Row) -> Memory:
-        """Convert database row to Memory."""
+        """Convert a row selected with MEMORY_COLUMNS to Memory."""
+        (
+            id_, type_, title, subtitle, content, facts_json, concepts_json,
+            files_read_json, files_modified_json, session_id, project,
+            category, importance, tags_json, metadata_json, created_at,
+            accessed_count, discovery_tokens,
+        ) = row
         return Memory(
-            id=row["id"],
-            type=row["type"] if "type" in row.keys() else "change",
-            title=row["title"] if "title" in row.keys() else "",
-            subtitle=row["subtitle"] if "subtitle" in row.keys() else "",
-            content=row["content"],
-            facts=json.loads(row["facts_json"]) if "facts_json" in row.keys() and row["facts_json"] else [],
-            concepts=json.loads(row["concepts_json"]) if "concepts_json" in row.keys() and row["concepts_json"] else [],
-            files_read=json.loads(row["files_read_json"]) if "files_read_json" in row.keys() and row["files_read_json"] else [],
-            files_modified=json.loads(row["files_modified_json"]) if "files_modified_json" in row.keys() and row["files_modified_json"] else [],
-            session_id=row["session_id"] if "session_id" in row.keys() else None,
-            project=row["project"] if "project" in row.keys() else None,
-            category=row["category"],
-            importance=row["importance"],
-            tags=json.loads(row["tags_json"]) if row["tags_json"] else [],
-            metadata=json.loads(row["metadata_json"]) if row["metadata_json"] else {},
-            created_at=datetime.fromisoformat(row["created_at"]),
-            accessed_count=row["accessed_count"],
-            discovery_tokens=row["discovery_tokens"] if "discovery_tokens" in row.keys() else 0,
+            id=id_,
+            type=type_,
+            title=title,
+            subtitle=subtitle,
+            content=content,
+            facts=_json_loads(facts_json) if facts_json else [],
+            concepts=_json_loads(concepts_json) if concepts_json else [],
+            files_read=_json_loads(files_read_json) if files_read_json else [],
+            files_modified=_json_loads(files_modified_json) if files_modified_json else [],
+            session_id=session_id,
+            project=project,
+            category=category,
+            importance=importance,
+            tags=_json_loads(tags_json) if tags_json else [],
+            metadata=_json_loads(metadata_json) if metadata_json else {},
+            created_at=datetime.fromisoformat(created_at),
+            accessed_count=accessed_count,
+            discovery_tokens=discovery_tokens or 0,
         )
 
+    def _row_to_memory_dict(self, row: sqlite3.Row) -> dict:
+        """
+        Convert a row selected with MEMORY_COLUMNS straight to the
+        Memory.to_dict() shape.
+
+        Skips building the intermediate Memory and reuses the ISO timestamp
+        stored at insert time instead of parsing and re-formatting it.
+        """
+        (
+            id_, type_, title, subtitle, content, facts_json, concepts_json,
+            files_read_json, files_modified_json, session_id, project,
+            category, importance, tags_json, metadata_json, created_at,
+            accessed_count, discovery_tokens,
+        ) = row
+        return {
+            "id": id_,
+            "type": type_,
+            "title": title,
+            "subtitle": subtitle,
+            "content": content,
+            "facts": _json_loads(facts_json) if facts_json else [],
+            "concepts": _json_loads(concepts_json) if concepts_json else [],
+            "files_read": _json_loads(files_read_json) if files_read_json else [],
+            "files_modified": _json_loads(files_modified_json) if files_modified_json else [],
+            "session_id": session_id,
+            "project": project,
+            "category": category,
+            "importance": importance,
+            "tags": _json_loads(tags_json) if tags_json else [],
+            "metadata": _json_loads(metadata_json) if metadata_json else {},
+            "created_at": created_at,
+            "accessed_count": accessed_count,
+            "discovery_tokens": discovery_tokens or 0,
+        }
+
     def _row_to_session(self, row: sqlite3.Row) -> Session:
         """Convert database row to Session."""
         return Session(
@@ -1349,35 +1799,187 @@ class MemoryStore:
             completed=row["completed"] or "",
             next_steps=row["next_steps"] or "",
             notes=row["notes"] or "",
-            files_read=json.loads(row["files_read_json"]) if row["files_read_json"] else [],
-            files_edited=json.loads(row["files_edited_json"]) if row["files_edited_json"] else [],
+            files_read=_json_loads(row["files_read_json"]) if row["files_read_json"] else [],
+            files_edited=_json_loads(row["files_edited_json"]) if row["files_edited_json"] else [],
             discovery_tokens=row["discovery_tokens"] or 0,
             created_at=datetime.fromisoformat(row["created_at"]),
         )
 
+    def _row_to_summary_dict(self, row: sqlite3.Row) -> dict:
+        """Convert database row straight to the SessionSummary.to_dict() shape."""
+        return {
+            "id": row["id"],
+            "session_id": row["session_id"],
+            "project": row["project"],
+            "request": row["request"] or "",
+            "investigated": row["investigated"] or "",
+            "learned": row["learned"] or "",
+            "completed": row["completed"] or "",
+            "next_steps": row["next_steps"] or "",
+            "notes": row["notes"] or "",
+            "files_read": _json_loads(row["files_read_json"]) if row["files_read_json"] else [],
+            "files_edited": _json_loads(row["files_edited_json"]) if row["files_edited_json"] else [],
+            "discovery_tokens": row["discovery_tokens"] or 0,
+            "created_at": row["created_at"],
+        }
+
     def _enforce_limit(self):
         """Remove oldest/least accessed memories if over limit."""
-        count = self.count()
-        if count <= self.max_memories:
+        if self.count() <= self.max_memories:
             return
         
-        to_remove = count - self.max_memories
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(f"""
+        # Eviction goes by access count, so it must see every queued access
+        self._flush_access()
+        
+        with self._connect() as conn:
+            # Take the write lock up front and size the overflow inside the
+            # statement so concurrent adds can't each trim the same excess
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.execute("""
                 DELETE FROM memories WHERE id IN (
                     SELECT id FROM memories
                     ORDER BY accessed_count ASC, created_at_epoch ASC
-                    LIMIT {to_remove}
+                    LIMIT MAX((SELECT COUNT(*) FROM memories) - ?, 0)
                 )
-            """)
-            conn.commit()
-            logger.info(f"Removed {to_remove} old memories to stay under limit")
+            """, (self.max_memories,))
+            removed = cursor.rowcount
+        
+        if removed > 0:
+            self._invalidate_caches()
+            self._evict()
+            logger.info(f"Removed {removed} old memories to stay under limit")
+
+    def _invalidate_caches(self):
+        """Drop cached reads after memories were written."""
+        with self._cache_lock:
+            self._version += 1
+            self._recent = None
+            self._concept_cache.clear()
+
+    def _read_data_version(self) -> Optional[int]:
+        """Return the watch connection's PRAGMA data_version (None in memory)."""
+        if self._memory_conn is not None:
+            return None
+        if self._watch is None:
+            self._watch = self._open_connection()
+        return self._watch.execute("PRAGMA data_version").fetchone()[0]
+
+    def _check_external_writes(self):
+        """
+        Drop every read cache if another connection has committed since the
+        last check (caller holds _cache_lock).
+
+        data_version changes whenever a connection other than the watch one
+        commits. The store's own commits are recorded by _note_own_write and
+        invalidate caches themselves, so only writes from elsewhere land
+        here. In-memory stores skip the check.
+        """
+        data_version = self._read_data_version()
+        if data_version == self._data_version:
+            return
+        self._data_version = data_version
+        self._version += 1
+        self._recent = None
+        self._concept_cache.clear()
+        self._get_cache.clear()
+
+    def _note_own_write(self):
+        """
+        Take the data_version after a commit from one of this store's pooled
+        connections as already seen.
+
+        A write from elsewhere landing between that commit and this read is
+        missed until the database next changes.
+        """
+        with self._cache_lock:
+            self._data_version = self._read_data_version()
+
+    def _evict(self, memory_id: Optional[str] = None):
+        """Drop one memory, or all of them, from the get() cache."""
+        with self._cache_lock:
+            if memory_id is None:
+                self._get_cache.clear()
+            else:
+                self._get_cache.pop(memory_id, None)
+
+    def _record_access(self, memory_id: str) -> bool:
+        """Buffer one access (caller holds _cache_lock); True when a flush is due."""
+        self._pending_access[memory_id] = self._pending_access.get(memory_id, 0) + 1
+        self._pending_hits += 1
+        return self._pending_hits >= self.ACCESS_FLUSH_INTERVAL
+
+    def _add_pending_access(self, items: list) -> list:
+        """
+        Add access counts not yet written to freshly built memories (or
+        Memory.to_dict() views), in place.
+
+        Rows and cached memories carry the stored count only; get() buffers
+        accesses (see _record_access), so every read path adds them here.
+        """
+        with self._cache_lock:
+            pending = dict(self._pending_access)
+        if pending:
+            for item in items:
+                if isinstance(item, Memory):
+                    item.accessed_count += pending.get(item.id, 0)
+                else:
+                    item["accessed_count"] += pending.get(item["id"], 0)
+        return items
+
+    def _flush_access(self):
+        """Write buffered access counts in one batch."""
+        with self._cache_lock:
+            pending, self._pending_access = self._pending_access, {}
+            self._pending_hits = 0
+        if not pending:
+            return
+        
+        with self._connect() as conn:
+            conn.executemany(
+                "UPDATE memories SET accessed_count = accessed_count + ? WHERE id = ?",
+                [(delta, memory_id) for memory_id, delta in pending.items()],
+            )
+        
+        self._invalidate_caches()
+
+    def clear(self):
+        """Delete all memories, sessions, summaries and prompts."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM user_prompts")
+            conn.execute("DELETE FROM session_summaries")
+            conn.execute("DELETE FROM memories")
+            conn.execute("DELETE FROM sessions")
+        
+        with self._cache_lock:
+            self._pending_access.clear()
+            self._pending_hits = 0
+        self._invalidate_caches()
+        self._evict()
+        logger.debug("Cleared memory store")
 
     def close(self):
         """
         Close the memory store.
         
-        This is a no-op since connections are ephemeral (each operation uses
-        a context manager). Provided for API completeness and cleanup protocols.
+        Closes all idle pooled connections and the connection that watches
+        for writes from elsewhere. The store stays usable; later operations
+        simply open new connections (a reopened watch connection drops the
+        read caches once). An in-memory store keeps its connection so the
+        data survives.
         """
-        logger.debug("MemoryStore.close() called (no-op - connections are ephemeral)")
+        self._flush_access()
+        
+        with self._cache_lock:
+            if self._watch is not None:
+                self._watch.close()
+                self._watch = None
+        
+        closed = 0
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            closed += 1
+        logger.debug(f"MemoryStore.close() closed {closed} pooled connections")
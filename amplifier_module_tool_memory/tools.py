@@ -14,7 +14,12 @@ Enhanced with claude-mem inspired capabilities:
 - Progressive disclosure (index vs full)
 """
 
-from typing import Any
+from copy import deepcopy
+from enum import StrEnum
+from functools import wraps
+from operator import itemgetter
+from typing import Any, Awaitable, Callable
+import asyncio
 import logging
 
 from amplifier_core import ToolResult
@@ -29,641 +34,684 @@ from .store import (
 logger = logging.getLogger(__name__)
 
 
+class _Schema:
+    """
+    Class-level input schema that hands every reader its own deep copy.
+
+    The schema is shared by all instances (and references module constants
+    such as OBSERVATION_TYPES), so callers must not be able to change it.
+    """
+    
+    def __init__(self, schema: dict[str, Any]):
+        self.schema = schema
+    
+    def __get__(self, obj: Any, objtype: Any = None) -> dict[str, Any]:
+        return deepcopy(self.schema)
+
+
+def _schema_defaults(schema: dict[str, Any]) -> dict[str, Any]:
+    """Map every property of an input schema to its declared default (None if absent)."""
+    return {
+        name: spec.get("default")
+        for name, spec in schema.get("properties", {}).items()
+    }
+
+
+class ErrorCode(StrEnum):
+    """Machine-readable codes carried in ToolResult.error["code"]."""
+    
+    CONTENT_REQUIRED = "content_required"
+    QUERY_REQUIRED = "query_required"
+    FILE_PATH_REQUIRED = "file_path_required"
+    CONCEPT_REQUIRED = "concept_required"
+    ID_REQUIRED = "id_required"
+    SESSION_ID_REQUIRED = "session_id_required"
+    NOT_FOUND = "not_found"
+    INTERNAL_ERROR = "internal_error"
+
+
+def _tool_execute(action: str):
+    """
+    Wrap a tool's execute() body with the shared result and error handling.
+
+    The body returns its output dict (wrapped in a successful ToolResult) or
+    a ToolResult for validation failures; any exception is logged as
+    "Failed to <action>" and returned as a failed ToolResult.
+    """
+    def decorator(
+        fn: Callable[[Any, dict[str, Any]], Awaitable[dict[str, Any] | ToolResult]],
+    ) -> Callable[[Any, dict[str, Any]], Awaitable[ToolResult]]:
+        @wraps(fn)
+        async def execute(self, input: dict[str, Any]) -> ToolResult:
+            try:
+                result = await fn(self, input)
+            except Exception as e:
+                logger.error("Failed to %s: %s", action, e)
+                return ToolResult(
+                    success=False,
+                    error={"code": ErrorCode.INTERNAL_ERROR, "message": str(e)}
+                )
+            if isinstance(result, ToolResult):
+                return result
+            return ToolResult(success=True, output=result)
+        return execute
+    return decorator
+
+
 class AddMemoryTool:
     """Tool to add a new memory/observation with rich metadata."""
     
-    def __init__(self, store: MemoryStore):
-        self.store = store
-    
-    @property
-    def name(self) -> str:
-        return "add_memory"
+    name = "add_memory"
     
-    @property
-    def description(self) -> str:
-        return (
-            "Store a new memory/observation with rich metadata. Use this when learning something important "
-            "that should be remembered across sessions. Supports structured observations with type, title, "
-            "facts, concepts, and file tracking."
-        )
+    description = (
+        "Store a new memory/observation with rich metadata. Use this when learning something important "
+        "that should be remembered across sessions. Supports structured observations with type, title, "
+        "facts, concepts, and file tracking."
+    )
     
-    @property
-    def input_schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "content": {
-                    "type": "string",
-                    "description": "The full narrative/content of the memory"
-                },
-                "type": {
-                    "type": "string",
-                    "enum": OBSERVATION_TYPES,
-                    "description": "Observation type: bugfix, feature, refactor, change, discovery, decision",
-                    "default": "change"
-                },
-                "title": {
-                    "type": "string",
-                    "description": "Short title (auto-generated if not provided)"
-                },
-                "subtitle": {
-                    "type": "string",
-                    "description": "One sentence explanation"
-                },
-                "facts": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of concise, self-contained facts"
-                },
-                "concepts": {
-                    "type": "array",
-                    "items": {"type": "string", "enum": CONCEPT_TYPES},
-                    "description": "Knowledge categories: how-it-works, why-it-exists, problem-solution, gotcha, pattern, trade-off"
-                },
-                "files_read": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Files that were read during this observation"
-                },
-                "files_modified": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Files that were modified"
-                },
-                "category": {
-                    "type": "string",
-                    "enum": MEMORY_CATEGORIES,
-                    "description": "Legacy category for organization",
-                    "default": "general"
-                },
-                "importance": {
-                    "type": "number",
-                    "minimum": 0.0,
-                    "maximum": 1.0,
-                    "description": "Importance score (0.0-1.0, higher = more important)",
-                    "default": 0.5
-                },
-                "tags": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Optional tags for filtering"
-                },
-                "session_id": {
-                    "type": "string",
-                    "description": "Session identifier for grouping"
-                },
-                "project": {
-                    "type": "string",
-                    "description": "Project name/path for filtering"
-                }
+    input_schema = _Schema({
+        "type": "object",
+        "properties": {
+            "content": {
+                "type": "string",
+                "description": "The full narrative/content of the memory"
             },
-            "required": ["content"]
-        }
+            "type": {
+                "type": "string",
+                "enum": OBSERVATION_TYPES,
+                "description": "Observation type: bugfix, feature, refactor, change, discovery, decision",
+                "default": "change"
+            },
+            "title": {
+                "type": "string",
+                "description": "Short title (auto-generated if not provided)",
+                "default": ""
+            },
+            "subtitle": {
+                "type": "string",
+                "description": "One sentence explanation",
+                "default": ""
+            },
+            "facts": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of concise, self-contained facts"
+            },
+            "concepts": {
+                "type": "array",
+                "items": {"type": "string", "enum": CONCEPT_TYPES},
+                "description": "Knowledge categories: how-it-works, why-it-exists, problem-solution, gotcha, pattern, trade-off"
+            },
+            "files_read": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Files that were read during this observation"
+            },
+            "files_modified": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Files that were modified"
+            },
+            "category": {
+                "type": "string",
+                "enum": MEMORY_CATEGORIES,
+                "description": "Legacy category for organization",
+                "default": "general"
+            },
+            "importance": {
+                "type": "number",
+                "minimum": 0.0,
+                "maximum": 1.0,
+                "description": "Importance score (0.0-1.0, higher = more important)",
+                "default": 0.5
+            },
+            "tags": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Optional tags for filtering"
+            },
+            "session_id": {
+                "type": "string",
+                "description": "Session identifier for grouping"
+            },
+            "project": {
+                "type": "string",
+                "description": "Project name/path for filtering"
+            }
+        },
+        "required": ["content"]
+    })
     
-    async def execute(self, input: dict[str, Any]) -> ToolResult:
-        try:
-            content = input.get("content", "")
-            if not content:
-                return ToolResult(success=False, error={"message": "Content is required"})
-            
-            memory = self.store.add(
-                content=content,
-                type=input.get("type", "change"),
-                title=input.get("title", ""),
-                subtitle=input.get("subtitle", ""),
-                facts=input.get("facts"),
-                concepts=input.get("concepts"),
-                files_read=input.get("files_read"),
-                files_modified=input.get("files_modified"),
-                session_id=input.get("session_id"),
-                project=input.get("project"),
-                category=input.get("category", "general"),
-                importance=input.get("importance", 0.5),
-                tags=input.get("tags"),
-            )
-            
+    _defaults = _schema_defaults(input_schema.schema)
+    _fields = itemgetter(
+        "content", "type", "title", "subtitle", "facts", "concepts", "files_read",
+        "files_modified", "session_id", "project", "category", "importance", "tags",
+    )
+    
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        # Bind hot store methods once instead of per execute()
+        self._add = store.add
+    
+    @_tool_execute("add memory")
+    async def execute(self, input: dict[str, Any]) -> dict[str, Any] | ToolResult:
+        (
+            content, type_, title, subtitle, facts, concepts, files_read,
+            files_modified, session_id, project, category, importance, tags,
+        ) = self._fields({**self._defaults, **input})
+        if not content:
             return ToolResult(
-                success=True,
-                output={
-                    "id": memory.id,
-                    "message": "Memory stored successfully",
-                    "type": memory.type,
-                    "title": memory.title,
-                }
+                success=False,
+                error={"code": ErrorCode.CONTENT_REQUIRED, "message": "Content is required"}
             )
-        except Exception as e:
-            logger.error(f"Failed to add memory: {e}")
-            return ToolResult(success=False, error={"message": str(e)})
+        
+        memory = await asyncio.to_thread(
+            self._add,
+            content=content,
+            type=type_,
+            title=title,
+            subtitle=subtitle,
+            facts=facts,
+            concepts=concepts,
+            files_read=files_read,
+            files_modified=files_modified,
+            session_id=session_id,
+            project=project,
+            category=category,
+            importance=importance,
+            tags=tags,
+        )
+        
+        return {
+            "id": memory.id,
+            "message": "Memory stored successfully",
+            "type": memory.type,
+            "title": memory.title,
+        }
 
 
 class ListMemoriesTool:
     """Tool to list memories with filtering."""
     
-    def __init__(self, store: MemoryStore):
-        self.store = store
+    name = "list_memories"
+    
+    description = (
+        "List stored memories with optional filtering by type, category, concepts, project, or importance. "
+        "Use index_only=true for lightweight listing with token estimates."
+    )
+    
+    input_schema = _Schema({
+        "type": "object",
+        "properties": {
+            "limit": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 100,
+                "description": "Maximum memories to return",
+                "default": 20
+            },
+            "type": {
+                "type": "string",
+                "enum": OBSERVATION_TYPES,
+                "description": "Filter by observation type"
+            },
+            "category": {
+                "type": "string",
+                "enum": MEMORY_CATEGORIES,
+                "description": "Filter by category"
+            },
+            "concepts": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Filter by concepts"
+            },
+            "concepts_match": {
+                "type": "string",
+                "enum": ["any", "all"],
+                "description": "Match memories with any of the concepts, or only those with all of them",
+                "default": "any"
+            },
+            "project": {
+                "type": "string",
+                "description": "Filter by project"
+            },
+            "session_id": {
+                "type": "string",
+                "description": "Filter by session"
+            },
+            "min_importance": {
+                "type": "number",
+                "minimum": 0.0,
+                "maximum": 1.0,
+                "description": "Filter by minimum importance"
+            },
+            "index_only": {
+                "type": "boolean",
+                "description": "Return lightweight index view (title, subtitle, token estimate)",
+                "default": False
+            }
+        }
+    })
     
-    @property
-    def name(self) -> str:
-        return "list_memories"
+    _defaults = _schema_defaults(input_schema.schema)
     
-    @property
-    def description(self) -> str:
-        return (
-            "List stored memories with optional filtering by type, category, concepts, project, or importance. "
-            "Use index_only=true for lightweight listing with token estimates."
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        self._list_all = store.list_all
+        self._list_index = store.list_index
+    
+    @_tool_execute("list memories")
+    async def execute(self, input: dict[str, Any]) -> dict[str, Any] | ToolResult:
+        args = {**self._defaults, **input}
+        
+        if args["index_only"]:
+            # Progressive disclosure: layer 1 (index)
+            memories = await asyncio.to_thread(
+                self._list_index,
+                limit=args["limit"],
+                project=args["project"],
+            )
+            return {
+                "count": len(memories),
+                "index_view": True,
+                "memories": memories
+            }
+        
+        # Full details
+        memories = await asyncio.to_thread(
+            self._list_all,
+            limit=args["limit"],
+            type=args["type"],
+            category=args["category"],
+            concepts=args["concepts"],
+            concepts_match=args["concepts_match"],
+            project=args["project"],
+            session_id=args["session_id"],
+            min_importance=args["min_importance"],
         )
-    
-    @property
-    def input_schema(self) -> dict:
+        
         return {
-            "type": "object",
-            "properties": {
-                "limit": {
-                    "type": "integer",
-                    "minimum": 1,
-                    "maximum": 100,
-                    "description": "Maximum memories to return",
-                    "default": 20
-                },
-                "type": {
-                    "type": "string",
-                    "enum": OBSERVATION_TYPES,
-                    "description": "Filter by observation type"
-                },
-                "category": {
-                    "type": "string",
-                    "enum": MEMORY_CATEGORIES,
-                    "description": "Filter by category"
-                },
-                "concepts": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Filter by concepts (any match)"
-                },
-                "project": {
-                    "type": "string",
-                    "description": "Filter by project"
-                },
-                "session_id": {
-                    "type": "string",
-                    "description": "Filter by session"
-                },
-                "min_importance": {
-                    "type": "number",
-                    "minimum": 0.0,
-                    "maximum": 1.0,
-                    "description": "Filter by minimum importance"
-                },
-                "index_only": {
-                    "type": "boolean",
-                    "description": "Return lightweight index view (title, subtitle, token estimate)",
-                    "default": False
-                }
-            }
+            "count": len(memories),
+            "memories": [m.to_dict() for m in memories]
         }
-    
-    async def execute(self, input: dict[str, Any]) -> ToolResult:
-        try:
-            index_only = input.get("index_only", False)
-            
-            if index_only:
-                # Progressive disclosure: layer 1 (index)
-                memories = self.store.list_index(
-                    limit=input.get("limit", 20),
-                    project=input.get("project"),
-                )
-                return ToolResult(
-                    success=True,
-                    output={
-                        "count": len(memories),
-                        "index_view": True,
-                        "memories": memories
-                    }
-                )
-            
-            # Full details
-            memories = self.store.list_all(
-                limit=input.get("limit", 20),
-                type=input.get("type"),
-                category=input.get("category"),
-                concepts=input.get("concepts"),
-                project=input.get("project"),
-                session_id=input.get("session_id"),
-                min_importance=input.get("min_importance"),
-            )
-            
-            return ToolResult(
-                success=True,
-                output={
-                    "count": len(memories),
-                    "memories": [m.to_dict() for m in memories]
-                }
-            )
-        except Exception as e:
-            logger.error(f"Failed to list memories: {e}")
-            return ToolResult(success=False, error={"message": str(e)})
 
 
 class SearchMemoriesTool:
     """Tool to search memories using FTS5 full-text search."""
     
-    def __init__(self, store: MemoryStore):
-        self.store = store
-    
-    @property
-    def name(self) -> str:
-        return "search_memories"
+    name = "search_memories"
     
-    @property
-    def description(self) -> str:
-        return (
-            "Search memories using full-text search. Returns memories sorted by relevance. "
-            "Searches title, subtitle, content, facts, and concepts."
-        )
+    description = (
+        "Search memories using full-text search. Returns memories sorted by relevance. "
+        "Searches title, subtitle, content, facts, and concepts."
+    )
     
-    @property
-    def input_schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "Search query (keywords)"
-                },
-                "limit": {
-                    "type": "integer",
-                    "minimum": 1,
-                    "maximum": 50,
-                    "description": "Maximum results to return",
-                    "default": 10
-                },
-                "type": {
-                    "type": "string",
-                    "enum": OBSERVATION_TYPES,
-                    "description": "Filter by observation type"
-                },
-                "project": {
-                    "type": "string",
-                    "description": "Filter by project"
-                }
+    input_schema = _Schema({
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Search query (keywords)"
             },
-            "required": ["query"]
-        }
+            "limit": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 50,
+                "description": "Maximum results to return",
+                "default": 10
+            },
+            "type": {
+                "type": "string",
+                "enum": OBSERVATION_TYPES,
+                "description": "Filter by observation type"
+            },
+            "project": {
+                "type": "string",
+                "description": "Filter by project"
+            }
+        },
+        "required": ["query"]
+    })
     
-    async def execute(self, input: dict[str, Any]) -> ToolResult:
-        try:
-            query = input.get("query", "")
-            if not query:
-                return ToolResult(success=False, error={"message": "Query is required"})
-            
-            memories = self.store.search(
-                query=query,
-                limit=input.get("limit", 10),
-                type=input.get("type"),
-                project=input.get("project"),
-            )
-            
+    _defaults = _schema_defaults(input_schema.schema)
+    
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        self._search = store.search
+    
+    @_tool_execute("search memories")
+    async def execute(self, input: dict[str, Any]) -> dict[str, Any] | ToolResult:
+        args = {**self._defaults, **input}
+        query = args["query"]
+        if not query:
             return ToolResult(
-                success=True,
-                output={
-                    "query": query,
-                    "count": len(memories),
-                    "memories": [m.to_dict() for m in memories]
-                }
+                success=False,
+                error={"code": ErrorCode.QUERY_REQUIRED, "message": "Query is required"}
             )
-        except Exception as e:
-            logger.error(f"Failed to search memories: {e}")
-            return ToolResult(success=False, error={"message": str(e)})
+        
+        memories = await asyncio.to_thread(
+            self._search,
+            query=query,
+            limit=args["limit"],
+            type=args["type"],
+            project=args["project"],
+            as_dicts=True,
+        )
+        
+        return {
+            "query": query,
+            "count": len(memories),
+            "memories": memories
+        }
 
 
 class SearchByFileTool:
     """Tool to search memories by file path."""
     
-    def __init__(self, store: MemoryStore):
-        self.store = store
+    name = "search_memories_by_file"
     
-    @property
-    def name(self) -> str:
-        return "search_memories_by_file"
-    
-    @property
-    def description(self) -> str:
-        return (
-            "Search memories by file path. Finds memories where the file was read or modified. "
-            "Useful for finding context about a specific file."
-        )
+    description = (
+        "Search memories by file path. Finds memories where the file was read or modified. "
+        "Useful for finding context about a specific file."
+    )
     
-    @property
-    def input_schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "file_path": {
-                    "type": "string",
-                    "description": "File path to search for"
-                },
-                "limit": {
-                    "type": "integer",
-                    "minimum": 1,
-                    "maximum": 50,
-                    "description": "Maximum results to return",
-                    "default": 10
-                }
+    input_schema = _Schema({
+        "type": "object",
+        "properties": {
+            "file_path": {
+                "type": "string",
+                "description": "File path to search for"
             },
-            "required": ["file_path"]
-        }
+            "limit": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 50,
+                "description": "Maximum results to return",
+                "default": 10
+            }
+        },
+        "required": ["file_path"]
+    })
     
-    async def execute(self, input: dict[str, Any]) -> ToolResult:
-        try:
-            file_path = input.get("file_path", "")
-            if not file_path:
-                return ToolResult(success=False, error={"message": "file_path is required"})
-            
-            memories = self.store.search_by_file(
-                file_path=file_path,
-                limit=input.get("limit", 10),
-            )
-            
+    _defaults = _schema_defaults(input_schema.schema)
+    
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        self._search_by_file = store.search_by_file
+    
+    @_tool_execute("search by file")
+    async def execute(self, input: dict[str, Any]) -> dict[str, Any] | ToolResult:
+        args = {**self._defaults, **input}
+        file_path = args["file_path"]
+        if not file_path:
             return ToolResult(
-                success=True,
-                output={
-                    "file_path": file_path,
-                    "count": len(memories),
-                    "memories": [m.to_dict() for m in memories]
-                }
+                success=False,
+                error={"code": ErrorCode.FILE_PATH_REQUIRED, "message": "file_path is required"}
             )
-        except Exception as e:
-            logger.error(f"Failed to search by file: {e}")
-            return ToolResult(success=False, error={"message": str(e)})
+        
+        memories = await asyncio.to_thread(
+            self._search_by_file,
+            file_path=file_path,
+            limit=args["limit"],
+            as_dicts=True,
+        )
+        
+        return {
+            "file_path": file_path,
+            "count": len(memories),
+            "memories": memories
+        }
 
 
 class SearchByConceptTool:
     """Tool to search memories by concept type."""
     
-    def __init__(self, store: MemoryStore):
-        self.store = store
+    name = "search_memories_by_concept"
     
-    @property
-    def name(self) -> str:
-        return "search_memories_by_concept"
-    
-    @property
-    def description(self) -> str:
-        return (
-            "Search memories by concept type. Concepts include: how-it-works, why-it-exists, "
-            "problem-solution, gotcha, pattern, trade-off."
-        )
+    description = (
+        "Search memories by concept type. Concepts include: how-it-works, why-it-exists, "
+        "problem-solution, gotcha, pattern, trade-off."
+    )
     
-    @property
-    def input_schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "concept": {
-                    "type": "string",
-                    "enum": CONCEPT_TYPES,
-                    "description": "Concept type to search for"
-                },
-                "limit": {
-                    "type": "integer",
-                    "minimum": 1,
-                    "maximum": 50,
-                    "description": "Maximum results to return",
-                    "default": 10
-                }
+    input_schema = _Schema({
+        "type": "object",
+        "properties": {
+            "concept": {
+                "type": "string",
+                "enum": CONCEPT_TYPES,
+                "description": "Concept type to search for"
             },
-            "required": ["concept"]
-        }
+            "limit": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 50,
+                "description": "Maximum results to return",
+                "default": 10
+            }
+        },
+        "required": ["concept"]
+    })
     
-    async def execute(self, input: dict[str, Any]) -> ToolResult:
-        try:
-            concept = input.get("concept", "")
-            if not concept:
-                return ToolResult(success=False, error={"message": "concept is required"})
-            
-            memories = self.store.search_by_concept(
-                concept=concept,
-                limit=input.get("limit", 10),
-            )
-            
+    _defaults = _schema_defaults(input_schema.schema)
+    
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        self._search_by_concept = store.search_by_concept
+    
+    @_tool_execute("search by concept")
+    async def execute(self, input: dict[str, Any]) -> dict[str, Any] | ToolResult:
+        args = {**self._defaults, **input}
+        concept = args["concept"]
+        if not concept:
             return ToolResult(
-                success=True,
-                output={
-                    "concept": concept,
-                    "count": len(memories),
-                    "memories": [m.to_dict() for m in memories]
-                }
+                success=False,
+                error={"code": ErrorCode.CONCEPT_REQUIRED, "message": "concept is required"}
             )
-        except Exception as e:
-            logger.error(f"Failed to search by concept: {e}")
-            return ToolResult(success=False, error={"message": str(e)})
+        
+        memories = await asyncio.to_thread(
+            self._search_by_concept,
+            concept=concept,
+            limit=args["limit"],
+        )
+        
+        return {
+            "concept": concept,
+            "count": len(memories),
+            "memories": [m.to_dict() for m in memories]
+        }
 
 
 class GetMemoryTool:
     """Tool to get a specific memory by ID."""
     
-    def __init__(self, store: MemoryStore):
-        self.store = store
+    name = "get_memory"
     
-    @property
-    def name(self) -> str:
-        return "get_memory"
+    description = "Get a specific memory by its ID with full details."
     
-    @property
-    def description(self) -> str:
-        return "Get a specific memory by its ID with full details."
+    input_schema = _Schema({
+        "type": "object",
+        "properties": {
+            "id": {
+                "type": "string",
+                "description": "Memory ID"
+            }
+        },
+        "required": ["id"]
+    })
     
-    @property
-    def input_schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "id": {
-                    "type": "string",
-                    "description": "Memory ID"
-                }
-            },
-            "required": ["id"]
-        }
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        self._get = store.get
     
-    async def execute(self, input: dict[str, Any]) -> ToolResult:
-        try:
-            memory_id = input.get("id", "")
-            if not memory_id:
-                return ToolResult(success=False, error={"message": "ID is required"})
-            
-            memory = self.store.get(memory_id)
-            
-            if memory is None:
-                return ToolResult(
-                    success=False,
-                    error={"message": f"Memory not found: {memory_id}"}
-                )
-            
+    @_tool_execute("get memory")
+    async def execute(self, input: dict[str, Any]) -> dict[str, Any] | ToolResult:
+        memory_id = input.get("id", "")
+        if not memory_id:
             return ToolResult(
-                success=True,
-                output=memory.to_dict()
+                success=False,
+                error={"code": ErrorCode.ID_REQUIRED, "message": "ID is required"}
             )
-        except Exception as e:
-            logger.error(f"Failed to get memory: {e}")
-            return ToolResult(success=False, error={"message": str(e)})
+        
+        memory = await asyncio.to_thread(self._get, memory_id)
+        
+        if memory is None:
+            return ToolResult(
+                success=False,
+                error={"code": ErrorCode.NOT_FOUND, "message": f"Memory not found: {memory_id}"}
+            )
+        
+        return memory.to_dict()
 
 
 class UpdateMemoryTool:
     """Tool to update an existing memory."""
     
-    def __init__(self, store: MemoryStore):
-        self.store = store
-    
-    @property
-    def name(self) -> str:
-        return "update_memory"
+    name = "update_memory"
     
-    @property
-    def description(self) -> str:
-        return "Update an existing memory's content, type, title, facts, concepts, or importance."
+    description = "Update an existing memory's content, type, title, facts, concepts, or importance."
     
-    @property
-    def input_schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "id": {
-                    "type": "string",
-                    "description": "Memory ID to update"
-                },
-                "content": {
-                    "type": "string",
-                    "description": "New content"
-                },
-                "type": {
-                    "type": "string",
-                    "enum": OBSERVATION_TYPES,
-                    "description": "New observation type"
-                },
-                "title": {
-                    "type": "string",
-                    "description": "New title"
-                },
-                "subtitle": {
-                    "type": "string",
-                    "description": "New subtitle"
-                },
-                "facts": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "New facts list"
-                },
-                "concepts": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "New concepts list"
-                },
-                "category": {
-                    "type": "string",
-                    "enum": MEMORY_CATEGORIES,
-                    "description": "New category"
-                },
-                "importance": {
-                    "type": "number",
-                    "minimum": 0.0,
-                    "maximum": 1.0,
-                    "description": "New importance score"
-                },
-                "tags": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "New tags"
-                }
+    input_schema = _Schema({
+        "type": "object",
+        "properties": {
+            "id": {
+                "type": "string",
+                "description": "Memory ID to update"
             },
-            "required": ["id"]
-        }
+            "content": {
+                "type": "string",
+                "description": "New content"
+            },
+            "type": {
+                "type": "string",
+                "enum": OBSERVATION_TYPES,
+                "description": "New observation type"
+            },
+            "title": {
+                "type": "string",
+                "description": "New title"
+            },
+            "subtitle": {
+                "type": "string",
+                "description": "New subtitle"
+            },
+            "facts": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "New facts list"
+            },
+            "concepts": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "New concepts list"
+            },
+            "category": {
+                "type": "string",
+                "enum": MEMORY_CATEGORIES,
+                "description": "New category"
+            },
+            "importance": {
+                "type": "number",
+                "minimum": 0.0,
+                "maximum": 1.0,
+                "description": "New importance score"
+            },
+            "tags": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "New tags"
+            }
+        },
+        "required": ["id"]
+    })
     
-    async def execute(self, input: dict[str, Any]) -> ToolResult:
-        try:
-            memory_id = input.get("id", "")
-            if not memory_id:
-                return ToolResult(success=False, error={"message": "ID is required"})
-            
-            memory = self.store.update(
-                memory_id=memory_id,
-                content=input.get("content"),
-                type=input.get("type"),
-                title=input.get("title"),
-                subtitle=input.get("subtitle"),
-                facts=input.get("facts"),
-                concepts=input.get("concepts"),
-                category=input.get("category"),
-                importance=input.get("importance"),
-                tags=input.get("tags"),
+    _defaults = _schema_defaults(input_schema.schema)
+    _fields = itemgetter(
+        "id", "content", "type", "title", "subtitle", "facts", "concepts", "category",
+        "importance", "tags",
+    )
+    
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        self._update = store.update
+    
+    @_tool_execute("update memory")
+    async def execute(self, input: dict[str, Any]) -> dict[str, Any] | ToolResult:
+        (
+            memory_id, content, type_, title, subtitle, facts, concepts, category,
+            importance, tags,
+        ) = self._fields({**self._defaults, **input})
+        if not memory_id:
+            return ToolResult(
+                success=False,
+                error={"code": ErrorCode.ID_REQUIRED, "message": "ID is required"}
             )
-            
-            if memory is None:
-                return ToolResult(
-                    success=False,
-                    error={"message": f"Memory not found: {memory_id}"}
-                )
-            
+        
+        memory = await asyncio.to_thread(
+            self._update,
+            memory_id=memory_id,
+            content=content,
+            type=type_,
+            title=title,
+            subtitle=subtitle,
+            facts=facts,
+            concepts=concepts,
+            category=category,
+            importance=importance,
+            tags=tags,
+        )
+        
+        if memory is None:
             return ToolResult(
-                success=True,
-                output={
-                    "message": "Memory updated successfully",
-                    "memory": memory.to_dict()
-                }
+                success=False,
+                error={"code": ErrorCode.NOT_FOUND, "message": f"Memory not found: {memory_id}"}
             )
-        except Exception as e:
-            logger.error(f"Failed to update memory: {e}")
-            return ToolResult(success=False, error={"message": str(e)})
+        
+        return {
+            "message": "Memory updated successfully",
+            "memory": memory.to_dict()
+        }
 
 
 class DeleteMemoryTool:
     """Tool to delete a memory."""
     
-    def __init__(self, store: MemoryStore):
-        self.store = store
+    name = "delete_memory"
     
-    @property
-    def name(self) -> str:
-        return "delete_memory"
+    description = "Delete a memory by its ID."
     
-    @property
-    def description(self) -> str:
-        return "Delete a memory by its ID."
+    input_schema = _Schema({
+        "type": "object",
+        "properties": {
+            "id": {
+                "type": "string",
+                "description": "Memory ID to delete"
+            }
+        },
+        "required": ["id"]
+    })
     
-    @property
-    def input_schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "id": {
-                    "type": "string",
-                    "description": "Memory ID to delete"
-                }
-            },
-            "required": ["id"]
-        }
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        self._delete = store.delete
     
-    async def execute(self, input: dict[str, Any]) -> ToolResult:
-        try:
-            memory_id = input.get("id", "")
-            if not memory_id:
-                return ToolResult(success=False, error={"message": "ID is required"})
-            
-            deleted = self.store.delete(memory_id)
-            
-            if not deleted:
-                return ToolResult(
-                    success=False,
-                    error={"message": f"Memory not found: {memory_id}"}
-                )
-            
+    @_tool_execute("delete memory")
+    async def execute(self, input: dict[str, Any]) -> dict[str, Any] | ToolResult:
+        memory_id = input.get("id", "")
+        if not memory_id:
+            return ToolResult(
+                success=False,
+                error={"code": ErrorCode.ID_REQUIRED, "message": "ID is required"}
+            )
+        
+        deleted = await asyncio.to_thread(self._delete, memory_id)
+        
+        if not deleted:
             return ToolResult(
-                success=True,
-                output={"message": f"Memory {memory_id} deleted successfully"}
+                success=False,
+                error={"code": ErrorCode.NOT_FOUND, "message": f"Memory not found: {memory_id}"}
             )
-        except Exception as e:
-            logger.error(f"Failed to delete memory: {e}")
-            return ToolResult(success=False, error={"message": str(e)})
+        
+        return {"message": f"Memory {memory_id} deleted successfully"}
 
 
 # =============================================================================
@@ -673,352 +721,338 @@ class DeleteMemoryTool:
 class CreateSessionTool:
     """Tool to create or continue a session."""
     
-    def __init__(self, store: MemoryStore):
-        self.store = store
+    name = "create_session"
     
-    @property
-    def name(self) -> str:
-        return "create_session"
-    
-    @property
-    def description(self) -> str:
-        return (
-            "Create a new session or continue an existing one. Sessions group related memories "
-            "and enable progress tracking."
-        )
+    description = (
+        "Create a new session or continue an existing one. Sessions group related memories "
+        "and enable progress tracking."
+    )
     
-    @property
-    def input_schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "session_id": {
-                    "type": "string",
-                    "description": "Session identifier (creates new or continues existing)"
-                },
-                "project": {
-                    "type": "string",
-                    "description": "Project name/path"
-                },
-                "user_prompt": {
-                    "type": "string",
-                    "description": "Initial user prompt for this session"
-                }
+    input_schema = _Schema({
+        "type": "object",
+        "properties": {
+            "session_id": {
+                "type": "string",
+                "description": "Session identifier (creates new or continues existing)"
             },
-            "required": ["session_id"]
-        }
+            "project": {
+                "type": "string",
+                "description": "Project name/path"
+            },
+            "user_prompt": {
+                "type": "string",
+                "description": "Initial user prompt for this session"
+            }
+        },
+        "required": ["session_id"]
+    })
     
-    async def execute(self, input: dict[str, Any]) -> ToolResult:
-        try:
-            session_id = input.get("session_id", "")
-            if not session_id:
-                return ToolResult(success=False, error={"message": "session_id is required"})
-            
-            session = self.store.create_session(
-                session_id=session_id,
-                project=input.get("project"),
-                user_prompt=input.get("user_prompt"),
-            )
-            
+    _defaults = _schema_defaults(input_schema.schema)
+    
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        self._create_session = store.create_session
+    
+    @_tool_execute("create session")
+    async def execute(self, input: dict[str, Any]) -> dict[str, Any] | ToolResult:
+        args = {**self._defaults, **input}
+        session_id = args["session_id"]
+        if not session_id:
             return ToolResult(
-                success=True,
-                output={
-                    "message": "Session created/continued",
-                    "session": session.to_dict()
-                }
+                success=False,
+                error={"code": ErrorCode.SESSION_ID_REQUIRED, "message": "session_id is required"}
             )
-        except Exception as e:
-            logger.error(f"Failed to create session: {e}")
-            return ToolResult(success=False, error={"message": str(e)})
+        
+        session = await asyncio.to_thread(
+            self._create_session,
+            session_id=session_id,
+            project=args["project"],
+            user_prompt=args["user_prompt"],
+        )
+        
+        return {
+            "message": "Session created/continued",
+            "session": session.to_dict()
+        }
 
 
 class AddSessionSummaryTool:
     """Tool to add a session progress summary."""
     
-    def __init__(self, store: MemoryStore):
-        self.store = store
+    name = "add_session_summary"
     
-    @property
-    def name(self) -> str:
-        return "add_session_summary"
+    description = (
+        "Add a progress summary for a session. Captures what was requested, investigated, "
+        "learned, completed, and next steps. Use periodically to checkpoint progress."
+    )
     
-    @property
-    def description(self) -> str:
-        return (
-            "Add a progress summary for a session. Captures what was requested, investigated, "
-            "learned, completed, and next steps. Use periodically to checkpoint progress."
-        )
-    
-    @property
-    def input_schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "session_id": {
-                    "type": "string",
-                    "description": "Session identifier"
-                },
-                "request": {
-                    "type": "string",
-                    "description": "What the user asked for"
-                },
-                "investigated": {
-                    "type": "string",
-                    "description": "What was explored/researched"
-                },
-                "learned": {
-                    "type": "string",
-                    "description": "Key insights gained"
-                },
-                "completed": {
-                    "type": "string",
-                    "description": "Work that was completed"
-                },
-                "next_steps": {
-                    "type": "string",
-                    "description": "Current trajectory/remaining work"
-                },
-                "notes": {
-                    "type": "string",
-                    "description": "Additional observations"
-                },
-                "files_read": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Files that were read"
-                },
-                "files_edited": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Files that were edited"
-                },
-                "project": {
-                    "type": "string",
-                    "description": "Project name/path"
-                }
+    input_schema = _Schema({
+        "type": "object",
+        "properties": {
+            "session_id": {
+                "type": "string",
+                "description": "Session identifier"
             },
-            "required": ["session_id"]
-        }
+            "request": {
+                "type": "string",
+                "description": "What the user asked for",
+                "default": ""
+            },
+            "investigated": {
+                "type": "string",
+                "description": "What was explored/researched",
+                "default": ""
+            },
+            "learned": {
+                "type": "string",
+                "description": "Key insights gained",
+                "default": ""
+            },
+            "completed": {
+                "type": "string",
+                "description": "Work that was completed",
+                "default": ""
+            },
+            "next_steps": {
+                "type": "string",
+                "description": "Current trajectory/remaining work",
+                "default": ""
+            },
+            "notes": {
+                "type": "string",
+                "description": "Additional observations",
+                "default": ""
+            },
+            "files_read": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Files that were read"
+            },
+            "files_edited": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Files that were edited"
+            },
+            "project": {
+                "type": "string",
+                "description": "Project name/path"
+            }
+        },
+        "required": ["session_id"]
+    })
     
-    async def execute(self, input: dict[str, Any]) -> ToolResult:
-        try:
-            session_id = input.get("session_id", "")
-            if not session_id:
-                return ToolResult(success=False, error={"message": "session_id is required"})
-            
-            summary = self.store.add_summary(
-                session_id=session_id,
-                request=input.get("request", ""),
-                investigated=input.get("investigated", ""),
-                learned=input.get("learned", ""),
-                completed=input.get("completed", ""),
-                next_steps=input.get("next_steps", ""),
-                notes=input.get("notes", ""),
-                files_read=input.get("files_read"),
-                files_edited=input.get("files_edited"),
-                project=input.get("project"),
-            )
-            
+    _defaults = _schema_defaults(input_schema.schema)
+    _fields = itemgetter(
+        "session_id", "request", "investigated", "learned", "completed", "next_steps",
+        "notes", "files_read", "files_edited", "project",
+    )
+    
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        self._add_summary = store.add_summary
+    
+    @_tool_execute("add session summary")
+    async def execute(self, input: dict[str, Any]) -> dict[str, Any] | ToolResult:
+        (
+            session_id, request, investigated, learned, completed, next_steps,
+            notes, files_read, files_edited, project,
+        ) = self._fields({**self._defaults, **input})
+        if not session_id:
             return ToolResult(
-                success=True,
-                output={
-                    "message": "Session summary added",
-                    "summary": summary.to_dict()
-                }
+                success=False,
+                error={"code": ErrorCode.SESSION_ID_REQUIRED, "message": "session_id is required"}
             )
-        except Exception as e:
-            logger.error(f"Failed to add session summary: {e}")
-            return ToolResult(success=False, error={"message": str(e)})
+        
+        summary = await asyncio.to_thread(
+            self._add_summary,
+            session_id=session_id,
+            request=request,
+            investigated=investigated,
+            learned=learned,
+            completed=completed,
+            next_steps=next_steps,
+            notes=notes,
+            files_read=files_read,
+            files_edited=files_edited,
+            project=project,
+        )
+        
+        return {
+            "message": "Session summary added",
+            "summary": summary.to_dict()
+        }
 
 
 class GetSessionContextTool:
     """Tool to get context for a session (progressive disclosure)."""
     
-    def __init__(self, store: MemoryStore):
-        self.store = store
+    name = "get_session_context"
     
-    @property
-    def name(self) -> str:
-        return "get_session_context"
-    
-    @property
-    def description(self) -> str:
-        return (
-            "Get context for injection at session start. Returns observation index (lightweight) "
-            "and last session summary. Use for progressive disclosure - get index first, then "
-            "fetch full details for relevant memories."
-        )
+    description = (
+        "Get context for injection at session start. Returns observation index (lightweight) "
+        "and last session summary. Use for progressive disclosure - get index first, then "
+        "fetch full details for relevant memories."
+    )
     
-    @property
-    def input_schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "project": {
-                    "type": "string",
-                    "description": "Filter by project"
-                },
-                "limit": {
-                    "type": "integer",
-                    "minimum": 1,
-                    "maximum": 100,
-                    "description": "Maximum observations in index",
-                    "default": 50
-                },
-                "include_summaries": {
-                    "type": "boolean",
-                    "description": "Include last session summary",
-                    "default": True
-                },
-                "days": {
-                    "type": "integer",
-                    "minimum": 1,
-                    "maximum": 365,
-                    "description": "Look back period in days",
-                    "default": 90
-                }
+    input_schema = _Schema({
+        "type": "object",
+        "properties": {
+            "project": {
+                "type": "string",
+                "description": "Filter by project"
+            },
+            "limit": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 100,
+                "description": "Maximum observations in index",
+                "default": 50
+            },
+            "include_summaries": {
+                "type": "boolean",
+                "description": "Include last session summary",
+                "default": True
+            },
+            "days": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 365,
+                "description": "Look back period in days",
+                "default": 90
             }
         }
+    })
     
-    async def execute(self, input: dict[str, Any]) -> ToolResult:
-        try:
-            context = self.store.get_context_for_session(
-                project=input.get("project"),
-                limit=input.get("limit", 50),
-                include_summaries=input.get("include_summaries", True),
-                days=input.get("days", 90),
-            )
-            
-            return ToolResult(
-                success=True,
-                output=context
-            )
-        except Exception as e:
-            logger.error(f"Failed to get session context: {e}")
-            return ToolResult(success=False, error={"message": str(e)})
+    _defaults = _schema_defaults(input_schema.schema)
+    
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        self._get_context_for_session = store.get_context_for_session
+    
+    @_tool_execute("get session context")
+    async def execute(self, input: dict[str, Any]) -> dict[str, Any] | ToolResult:
+        args = {**self._defaults, **input}
+        context = await asyncio.to_thread(
+            self._get_context_for_session,
+            project=args["project"],
+            limit=args["limit"],
+            include_summaries=args["include_summaries"],
+            days=args["days"],
+        )
+        
+        return context
 
 
 class SearchSummariesTool:
     """Tool to search session summaries."""
     
-    def __init__(self, store: MemoryStore):
-        self.store = store
+    name = "search_summaries"
     
-    @property
-    def name(self) -> str:
-        return "search_summaries"
-    
-    @property
-    def description(self) -> str:
-        return (
-            "Search session summaries using full-text search. Finds summaries matching query "
-            "across request, investigated, learned, completed, next_steps, and notes fields."
-        )
+    description = (
+        "Search session summaries using full-text search. Finds summaries matching query "
+        "across request, investigated, learned, completed, next_steps, and notes fields."
+    )
     
-    @property
-    def input_schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "Search query"
-                },
-                "limit": {
-                    "type": "integer",
-                    "minimum": 1,
-                    "maximum": 50,
-                    "description": "Maximum results",
-                    "default": 10
-                }
+    input_schema = _Schema({
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Search query"
             },
-            "required": ["query"]
-        }
+            "limit": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 50,
+                "description": "Maximum results",
+                "default": 10
+            }
+        },
+        "required": ["query"]
+    })
     
-    async def execute(self, input: dict[str, Any]) -> ToolResult:
-        try:
-            query = input.get("query", "")
-            if not query:
-                return ToolResult(success=False, error={"message": "query is required"})
-            
-            summaries = self.store.search_summaries(
-                query=query,
-                limit=input.get("limit", 10),
-            )
-            
+    _defaults = _schema_defaults(input_schema.schema)
+    
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        self._search_summaries = store.search_summaries
+    
+    @_tool_execute("search summaries")
+    async def execute(self, input: dict[str, Any]) -> dict[str, Any] | ToolResult:
+        args = {**self._defaults, **input}
+        query = args["query"]
+        if not query:
             return ToolResult(
-                success=True,
-                output={
-                    "query": query,
-                    "count": len(summaries),
-                    "summaries": [s.to_dict() for s in summaries]
-                }
+                success=False,
+                error={"code": ErrorCode.QUERY_REQUIRED, "message": "query is required"}
             )
-        except Exception as e:
-            logger.error(f"Failed to search summaries: {e}")
-            return ToolResult(success=False, error={"message": str(e)})
+        
+        summaries = await asyncio.to_thread(
+            self._search_summaries,
+            query=query,
+            limit=args["limit"],
+        )
+        
+        return {
+            "query": query,
+            "count": len(summaries),
+            "summaries": [s.to_dict() for s in summaries]
+        }
 
 
 class GetTimelineTool:
     """Tool to get a timeline of context around a point in time."""
     
-    def __init__(self, store: MemoryStore):
-        self.store = store
+    name = "get_timeline"
     
-    @property
-    def name(self) -> str:
-        return "get_timeline"
-    
-    @property
-    def description(self) -> str:
-        return (
-            "Get a timeline of observations and summaries around a specific point in time. "
-            "Useful for understanding what happened in a time window."
-        )
+    description = (
+        "Get a timeline of observations and summaries around a specific point in time. "
+        "Useful for understanding what happened in a time window."
+    )
     
-    @property
-    def input_schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "center_epoch": {
-                    "type": "integer",
-                    "description": "Center point in epoch milliseconds (default: now)"
-                },
-                "window_hours": {
-                    "type": "integer",
-                    "minimum": 1,
-                    "maximum": 168,
-                    "description": "Hours before and after center",
-                    "default": 24
-                },
-                "project": {
-                    "type": "string",
-                    "description": "Filter by project"
-                },
-                "limit": {
-                    "type": "integer",
-                    "minimum": 1,
-                    "maximum": 100,
-                    "description": "Maximum items per category",
-                    "default": 50
-                }
+    input_schema = _Schema({
+        "type": "object",
+        "properties": {
+            "center_epoch": {
+                "type": "integer",
+                "description": "Center point in epoch milliseconds (default: now)"
+            },
+            "window_hours": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 168,
+                "description": "Hours before and after center",
+                "default": 24
+            },
+            "project": {
+                "type": "string",
+                "description": "Filter by project"
+            },
+            "limit": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 100,
+                "description": "Maximum items per category",
+                "default": 50
             }
         }
+    })
     
-    async def execute(self, input: dict[str, Any]) -> ToolResult:
-        try:
-            timeline = self.store.get_timeline(
-                center_epoch=input.get("center_epoch"),
-                window_hours=input.get("window_hours", 24),
-                project=input.get("project"),
-                limit=input.get("limit", 50),
-            )
-            
-            return ToolResult(
-                success=True,
-                output=timeline
-            )
-        except Exception as e:
-            logger.error(f"Failed to get timeline: {e}")
-            return ToolResult(success=False, error={"message": str(e)})
+    _defaults = _schema_defaults(input_schema.schema)
+    
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        self._get_timeline = store.get_timeline
+    
+    @_tool_execute("get timeline")
+    async def execute(self, input: dict[str, Any]) -> dict[str, Any] | ToolResult:
+        args = {**self._defaults, **input}
+        timeline = await asyncio.to_thread(
+            self._get_timeline,
+            center_epoch=args["center_epoch"],
+            window_hours=args["window_hours"],
+            project=args["project"],
+            limit=args["limit"],
+        )
+        
+        return timeline
@@ -1,13 +1,114 @@
 """Test fixtures for tool-memory module."""
 
+from types import SimpleNamespace
+
 import pytest
-import tempfile
-from pathlib import Path
+
+from amplifier_module_tool_memory.store import MemoryStore
+from amplifier_module_tool_memory.tools import (
+    AddMemoryTool,
+    SearchMemoriesTool,
+    DeleteMemoryTool,
+)
+
+try:
+    import uvloop
+except ImportError:  # Optional (not available on Windows) - asyncio's loop is used
+    uvloop = None
+
+# Test data is disposable, so skip journaling and syncs. EXCLUSIVE locking
+# is left out: pooled connections share the database and would block
+TEST_PRAGMAS = {"journal_mode": "MEMORY", "synchronous": "OFF"}
+
+
+if uvloop is not None:
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop's faster event loop."""
+        return {"uvloop": uvloop.new_event_loop}
 
 
 @pytest.fixture
 def temp_db():
-    """Create a temporary database file for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test_memories.db"
-        yield db_path
+    """
+    Database path for a private store that lives only in memory.
+
+    Every ":memory:" store has its own private database, so stores never
+    collide across tests or xdist workers.
+    """
+    return ":memory:"
+
+
+@pytest.fixture(scope="session")
+def _shared_store():
+    """One in-memory store per session (per xdist worker), so schema setup runs once."""
+    store = MemoryStore(db_path=":memory:", pragmas=TEST_PRAGMAS)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def store(_shared_store):
+    """Provide the shared store, emptied again after each test."""
+    yield _shared_store
+    _shared_store.clear()
+
+
+@pytest.fixture
+def make_store():
+    """Build private stores for one test and close them all afterwards."""
+    stores = []
+
+    def make(**kwargs):
+        store = MemoryStore(**kwargs)
+        stores.append(store)
+        return store
+
+    yield make
+    for store in stores:
+        store.close()
+
+
+@pytest.fixture
+def populated_store(store):
+    """Provide the store seeded with three memories in one batch."""
+    store.add_many([
+        {"content": "Memory 1", "category": "learning"},
+        {"content": "Memory 2", "category": "decision"},
+        {"content": "Memory 3", "category": "learning"},
+    ])
+    return store
+
+
+@pytest.fixture(scope="module")
+def tools(_shared_store):
+    """
+    Provide the tools under test, bound to the shared store and built once
+    per module.
+
+    Tests reach them through add_tool, search_tool and delete_tool, which
+    also request ``store`` so the data is cleared afterwards.
+    """
+    return SimpleNamespace(
+        add=AddMemoryTool(_shared_store),
+        search=SearchMemoriesTool(_shared_store),
+        delete=DeleteMemoryTool(_shared_store),
+    )
+
+
+@pytest.fixture
+def add_tool(store, tools):
+    """Provide the store and an AddMemoryTool bound to it."""
+    return store, tools.add
+
+
+@pytest.fixture
+def search_tool(store, tools):
+    """Provide the store and a SearchMemoriesTool bound to it."""
+    return store, tools.search
+
+
+@pytest.fixture
+def delete_tool(store, tools):
+    """Provide the store and a DeleteMemoryTool bound to it."""
+    return store, tools.delete
@@ -1,16 +1,13 @@
 """Tests for the memory store."""
 
 import pytest
-from amplifier_module_tool_memory.store import MemoryStore
 
 
 class TestMemoryStore:
     """Tests for MemoryStore."""
     
-    def test_add_memory(self, temp_db):
+    def test_add_memory(self, store):
         """Test adding a memory."""
-        store = MemoryStore(db_path=temp_db)
-        
         memory = store.add(
             content="Test memory content",
             category="learning",
@@ -24,10 +21,8 @@ class TestMemoryStore:
         assert memory.importance == 0.8
         assert memory.tags == ["test", "example"]
     
-    def test_get_memory(self, temp_db):
+    def test_get_memory(self, store):
         """Test retrieving a memory by ID."""
-        store = MemoryStore(db_path=temp_db)
-        
         created = store.add(content="Retrievable memory")
         retrieved = store.get(created.id)
         
@@ -35,52 +30,217 @@ class TestMemoryStore:
         assert retrieved.content == "Retrievable memory"
         assert retrieved.accessed_count == 1  # Incremented on get
     
-    def test_get_nonexistent_memory(self, temp_db):
-        """Test retrieving a non-existent memory."""
-        store = MemoryStore(db_path=temp_db)
+    def test_repeated_get_counts_every_access(self, store):
+        """Test that buffered get() accesses show up on every read path."""
+        created = store.add(content="Hot memory")
+        for _ in range(3):
+            retrieved = store.get(created.id)
+        assert retrieved.accessed_count == 3
+        
+        assert store.list_all()[0].accessed_count == 3
+        assert store.list_all(limit=5)[0].accessed_count == 3
+        assert store.search("Hot")[0].accessed_count == 3
+        assert store.search("Hot", as_dicts=True)[0]["accessed_count"] == 3
+        
+        store.get(created.id)  # The cached listing picks this up too
+        assert store.list_all(limit=5)[0].accessed_count == 4
+    
+    def test_get_returns_independent_copies(self, store):
+        """Test that changing a fetched memory doesn't change later gets."""
+        created = store.add(content="Original", tags=["a"])
+        
+        for _ in range(2):  # Miss, then cache hit
+            fetched = store.get(created.id)
+            fetched.content = "Changed"
+            fetched.tags.append("X")
+        
+        again = store.get(created.id)
+        assert again.content == "Original"
+        assert again.tags == ["a"]
+    
+    def test_caches_see_writes_from_other_stores(self, make_store, tmp_path):
+        """Test that cached reads notice writes through another store on the file."""
+        db_path = tmp_path / "shared.db"
+        writer = make_store(db_path=db_path)
+        reader = make_store(db_path=db_path)
+        
+        memory = writer.add(content="Shared", concepts=["gotcha"])
+        assert reader.get(memory.id) is not None
+        assert len(reader.list_all(limit=20)) == 1
+        assert len(reader.search_by_concept("gotcha")) == 1
+        
+        writer.add(content="Another")
+        writer.delete(memory.id)
+        
+        assert reader.get(memory.id) is None
+        assert [m.content for m in reader.list_all(limit=20)] == ["Another"]
+        assert reader.search_by_concept("gotcha") == []
+        
+        # A closed store reopens its watch connection and keeps noticing
+        reader.close()
+        assert reader._watch is None
+        writer.add(content="After close")
+        assert len(reader.list_all(limit=20)) == 2
+    
+    def test_own_writes_keep_get_cache(self, make_store, tmp_path):
+        """Test that a store's own writes and access flushes don't empty the get() cache."""
+        store = make_store(db_path=tmp_path / "memories.db")
+        memory = store.add(content="Hot memory")
+        store.get(memory.id)
+        cached = store._get_cache[memory.id]
+        
+        store.add(content="Another")
+        for _ in range(store.ACCESS_FLUSH_INTERVAL):
+            store.get(memory.id)
         
+        assert store.get(memory.id).accessed_count == store.ACCESS_FLUSH_INTERVAL + 2
+        assert store._get_cache[memory.id] is cached
+    
+    def test_get_nonexistent_memory(self, store):
+        """Test retrieving a non-existent memory."""
         result = store.get("nonexistent-id")
         assert result is None
     
-    def test_list_all(self, temp_db):
+    def test_list_all(self, populated_store):
         """Test listing all memories."""
-        store = MemoryStore(db_path=temp_db)
+        all_memories = populated_store.list_all()
+        assert len(all_memories) == 3
+    
+    def test_list_all_reflects_writes(self, store):
+        """Test that repeated unfiltered listings see adds and deletes."""
+        first = store.add(content="Memory 1")
+        assert len(store.list_all(limit=20)) == 1
         
-        store.add(content="Memory 1", category="learning")
-        store.add(content="Memory 2", category="decision")
-        store.add(content="Memory 3", category="learning")
+        store.add(content="Memory 2")
+        assert len(store.list_all(limit=20)) == 2
         
-        all_memories = store.list_all()
-        assert len(all_memories) == 3
+        store.delete(first.id)
+        assert [m.content for m in store.list_all(limit=20)] == ["Memory 2"]
     
-    def test_list_by_category(self, temp_db):
-        """Test filtering by category."""
-        store = MemoryStore(db_path=temp_db)
+    def test_list_all_returns_independent_copies(self, store):
+        """Test that changing a listed memory doesn't change later listings."""
+        created = store.add(content="Listed", tags=["a"])
         
-        store.add(content="Learning 1", category="learning")
-        store.add(content="Decision 1", category="decision")
-        store.add(content="Learning 2", category="learning")
+        for _ in range(2):  # Miss, then cache hit
+            listed = store.list_all(limit=5)[0]
+            listed.title = "X"
+            listed.tags.append("X")
         
-        learning = store.list_all(category="learning")
+        again = store.list_all(limit=5)[0]
+        assert again.title == created.title
+        assert again.tags == ["a"]
+    
+    def test_list_by_category(self, populated_store):
+        """Test filtering by category."""
+        learning = populated_store.list_all(category="learning")
         assert len(learning) == 2
         assert all(m.category == "learning" for m in learning)
     
-    def test_search(self, temp_db):
-        """Test keyword search."""
-        store = MemoryStore(db_path=temp_db)
+    def test_list_index_by_project(self, store):
+        """Test that the filtered index view matches Memory.to_index()."""
+        store.add(content="In project", project="alpha", concepts=["gotcha"])
+        store.add(content="Elsewhere", project="beta")
         
-        store.add(content="Python is a programming language")
-        store.add(content="JavaScript is also a language")
-        store.add(content="The weather is nice today")
+        index = store.list_index(project="alpha", since_epoch=0)
+        expected = [m.to_index() for m in store.list_all(project="alpha")]
+        assert index == expected
+        assert index[0]["token_estimate"] == len("In project") // 4
+    
+    def test_timeline_matches_to_dict(self, store):
+        """Test that timeline observations match Memory.to_dict()."""
+        store.add(
+            content="Fixed the flaky test",
+            type="bugfix",
+            facts=["Race in setup"],
+            concepts=["gotcha"],
+            files_modified=["tests/conftest.py"],
+            project="alpha",
+            tags=["tests"],
+            metadata={"pr": 12},
+        )
+        store.add(content="Plain note", project="alpha")
+        
+        timeline = store.get_timeline(project="alpha")
+        assert timeline["observations"] == [m.to_dict() for m in store.list_all(project="alpha")]
+    
+    def test_summary_dicts_match_to_dict(self, store):
+        """Test that summary dicts from every read path match SessionSummary.to_dict()."""
+        store.add_summary(
+            session_id="session-1",
+            request="Speed up the tests",
+            learned="Schema setup dominated",
+            files_edited=["tests/conftest.py"],
+            project="alpha",
+            discovery_tokens=120,
+        )
+        expected = [s.to_dict() for s in store.get_summaries(project="alpha")]
+        
+        assert store.get_summaries(project="alpha", as_dicts=True) == expected
+        assert store.get_context_for_session(project="alpha")["last_summary"] == expected[0]
+        assert store.get_timeline(project="alpha")["summaries"] == expected
+    
+    def test_list_by_concepts_match(self, store):
+        """Test any/all matching of concept filters."""
+        store.add(content="Both", concepts=["gotcha", "pattern"])
+        store.add(content="Gotcha only", concepts=["gotcha"])
+        store.add(content="Neither", concepts=["trade-off"])
+        
+        any_match = store.list_all(concepts=["gotcha", "pattern"])
+        all_match = store.list_all(concepts=["gotcha", "pattern"], concepts_match="all")
+        
+        assert len(any_match) == 2
+        assert [m.content for m in all_match] == ["Both"]
+    
+    def test_json_filters_match_non_ascii(self, store):
+        """Test that concept and file filters match values with non-ASCII text."""
+        store.add(content="Accents", concepts=["café"], files_read=["docs/résumé.md"])
+        
+        assert len(store.list_all(concepts=["café"])) == 1
+        assert len(store.search_by_concept("café")) == 1
+        assert len(store.search_by_file("docs/résumé.md")) == 1
+    
+    def test_search_by_concept_sees_updates(self, store):
+        """Test that repeated concept searches reflect later writes."""
+        memory = store.add(content="Trap", concepts=["gotcha"])
+        assert len(store.search_by_concept("gotcha")) == 1
+        
+        store.update(memory.id, concepts=["pattern"])
+        assert store.search_by_concept("gotcha") == []
+    
+    def test_search_by_concept_returns_independent_copies(self, store):
+        """Test that changing a concept search result doesn't change later searches."""
+        store.add(content="Trap", concepts=["gotcha"], importance=0.8)
+        
+        for _ in range(2):  # Miss, then cache hit
+            found = store.search_by_concept("gotcha")[0]
+            found.importance = 0.0
+            found.concepts.append("X")
+        
+        again = store.search_by_concept("gotcha")[0]
+        assert again.importance == 0.8
+        assert again.concepts == ["gotcha"]
+    
+    def test_search(self, store):
+        """Test keyword search."""
+        store.add_many([
+            {"content": "Python is a programming language"},
+            {"content": "JavaScript is also a language"},
+            {"content": "The weather is nice today"},
+        ])
         
         results = store.search("programming language")
         assert len(results) >= 1
         assert "programming" in results[0].content.lower()
     
-    def test_update_memory(self, temp_db):
-        """Test updating a memory."""
-        store = MemoryStore(db_path=temp_db)
+    def test_search_with_punctuation(self, store):
+        """Test that queries that aren't FTS5 syntax still use the index."""
+        store.add(content="Python is a programming language")
         
+        results = store.search("language?")
+        assert [m.content for m in results] == ["Python is a programming language"]
+    
+    def test_update_memory(self, store):
+        """Test updating a memory."""
         created = store.add(content="Original content", importance=0.5)
         updated = store.update(created.id, content="Updated content", importance=0.9)
         
@@ -88,10 +248,8 @@ class TestMemoryStore:
         assert updated.content == "Updated content"
         assert updated.importance == 0.9
     
-    def test_delete_memory(self, temp_db):
+    def test_delete_memory(self, store):
         """Test deleting a memory."""
-        store = MemoryStore(db_path=temp_db)
-        
         created = store.add(content="To be deleted")
         assert store.count() == 1
         
@@ -99,28 +257,26 @@ class TestMemoryStore:
         assert deleted is True
         assert store.count() == 0
     
-    def test_enforce_limit(self, temp_db):
+    def test_enforce_limit(self, make_store, temp_db):
         """Test that max_memories limit is enforced."""
-        store = MemoryStore(db_path=temp_db, max_memories=3)
+        store = make_store(db_path=temp_db, max_memories=3)
         
-        store.add(content="Memory 1")
-        store.add(content="Memory 2")
-        store.add(content="Memory 3")
+        store.add_many([
+            {"content": "Memory 1"},
+            {"content": "Memory 2"},
+            {"content": "Memory 3"},
+        ])
         store.add(content="Memory 4")  # Should trigger cleanup
         
         assert store.count() == 3
     
-    def test_invalid_category_defaults_to_general(self, temp_db):
+    def test_invalid_category_defaults_to_general(self, store):
         """Test that invalid category defaults to general."""
-        store = MemoryStore(db_path=temp_db)
-        
         memory = store.add(content="Test", category="invalid_category")
         assert memory.category == "general"
     
-    def test_importance_clamped(self, temp_db):
+    def test_importance_clamped(self, store):
         """Test that importance is clamped to 0.0-1.0."""
-        store = MemoryStore(db_path=temp_db)
-        
         high = store.add(content="High", importance=2.0)
         low = store.add(content="Low", importance=-1.0)
         
@@ -1,95 +1,122 @@
 """Tests for the memory tools."""
 
-import pytest
-from amplifier_module_tool_memory.store import MemoryStore
+import asyncio
+from unittest.mock import Mock
+
+from amplifier_module_tool_memory.store import OBSERVATION_TYPES, MemoryStore
 from amplifier_module_tool_memory.tools import (
     AddMemoryTool,
-    ListMemoriesTool,
-    SearchMemoriesTool,
-    GetMemoryTool,
-    UpdateMemoryTool,
     DeleteMemoryTool,
+    ErrorCode,
+    SearchMemoriesTool,
 )
 
 
 class TestAddMemoryTool:
     """Tests for AddMemoryTool."""
     
-    @pytest.mark.asyncio
-    async def test_add_memory_success(self, temp_db):
-        """Test successful memory addition."""
-        store = MemoryStore(db_path=temp_db)
-        tool = AddMemoryTool(store)
-        
+    async def test_add(self, add_tool):
+        """Test memory addition."""
+        _, tool = add_tool
         result = await tool.execute({
             "content": "Test memory",
             "category": "learning",
-            "importance": 0.8
+            "importance": 0.8,
         })
         
         assert result.success is True
         assert "id" in result.output
     
-    @pytest.mark.asyncio
-    async def test_add_memory_missing_content(self, temp_db):
-        """Test error when content is missing."""
-        store = MemoryStore(db_path=temp_db)
-        tool = AddMemoryTool(store)
+    async def test_add_without_content(self):
+        """Test the error when content is missing, against a stub store."""
+        store = Mock(spec=MemoryStore)
         
-        result = await tool.execute({})
+        result = await AddMemoryTool(store).execute({})
         
         assert result.success is False
-        assert "Content is required" in result.error["message"]
+        assert result.error["code"] == ErrorCode.CONTENT_REQUIRED
+        store.add.assert_not_called()
+    
+    def test_input_schema_is_a_copy(self):
+        """Test that changing a tool's input_schema leaves the shared schema alone."""
+        schema = AddMemoryTool.input_schema
+        schema["properties"]["type"]["enum"].append("other")
+        
+        assert "other" not in AddMemoryTool.input_schema["properties"]["type"]["enum"]
+        assert "other" not in OBSERVATION_TYPES
+    
+    async def test_concurrent_adds_in_memory(self, make_store, temp_db):
+        """Test that concurrent adds all succeed on an in-memory store."""
+        store = make_store(db_path=temp_db)
+        tool = AddMemoryTool(store)
+        
+        results = await asyncio.gather(*(
+            tool.execute({"content": f"Memory {i}"}) for i in range(100)
+        ))
+        
+        assert all(result.success for result in results)
+        assert store.count() == 100
+    
+    async def test_concurrent_adds_respect_limit(self, make_store, tmp_path):
+        """Test that concurrent adds on a file store all succeed and keep the limit."""
+        store = make_store(db_path=tmp_path / "memories.db", max_memories=5)
+        tool = AddMemoryTool(store)
+        
+        results = await asyncio.gather(*(
+            tool.execute({"content": f"Memory {i}"}) for i in range(50)
+        ))
+        
+        assert all(result.success for result in results)
+        assert store.count() == store.max_memories
 
 
 class TestSearchMemoriesTool:
     """Tests for SearchMemoriesTool."""
     
-    @pytest.mark.asyncio
-    async def test_search_finds_matches(self, temp_db):
-        """Test that search finds matching memories."""
-        store = MemoryStore(db_path=temp_db)
-        store.add(content="Python programming tips")
-        store.add(content="JavaScript tips")
+    async def test_search(self, search_tool):
+        """Test that search finds the best match."""
+        store, tool = search_tool
+        store.add_many([
+            {"content": "Python programming tips"},
+            {"content": "JavaScript tips"},
+        ])
         
-        tool = SearchMemoriesTool(store)
-        result = await tool.execute({"query": "Python"})
+        result = await tool.execute({"query": "Python", "limit": 1})
         
         assert result.success is True
-        assert result.output["count"] >= 1
+        assert result.output["memories"][0]["content"] == "Python programming tips"
     
-    @pytest.mark.asyncio
-    async def test_search_missing_query(self, temp_db):
-        """Test error when query is missing."""
-        store = MemoryStore(db_path=temp_db)
-        tool = SearchMemoriesTool(store)
+    async def test_search_without_query(self):
+        """Test the error when the query is missing, against a stub store."""
+        store = Mock(spec=MemoryStore)
         
-        result = await tool.execute({})
+        result = await SearchMemoriesTool(store).execute({})
         
         assert result.success is False
+        assert result.error["code"] == ErrorCode.QUERY_REQUIRED
+        store.search.assert_not_called()
 
 
 class TestDeleteMemoryTool:
     """Tests for DeleteMemoryTool."""
     
-    @pytest.mark.asyncio
-    async def test_delete_success(self, temp_db):
-        """Test successful deletion."""
-        store = MemoryStore(db_path=temp_db)
+    async def test_delete(self, delete_tool):
+        """Test memory deletion."""
+        store, tool = delete_tool
         memory = store.add(content="To delete")
         
-        tool = DeleteMemoryTool(store)
         result = await tool.execute({"id": memory.id})
         
         assert result.success is True
-        assert store.count() == 0
+        assert store.get(memory.id) is None
     
-    @pytest.mark.asyncio
-    async def test_delete_nonexistent(self, temp_db):
-        """Test deleting non-existent memory."""
-        store = MemoryStore(db_path=temp_db)
-        tool = DeleteMemoryTool(store)
+    async def test_delete_nonexistent(self):
+        """Test the error for a non-existent memory, against a stub store."""
+        store = Mock(spec=MemoryStore)
+        store.delete.return_value = False
         
-        result = await tool.execute({"id": "nonexistent"})
+        result = await DeleteMemoryTool(store).execute({"id": "nonexistent"})
         
         assert result.success is False
+        assert result.error["code"] == ErrorCode.NOT_FOUND
+        store.delete.assert_called_once_with("nonexistent")